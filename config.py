@@ -9,6 +9,8 @@ DESIGN UPDATE (Premium UX):
 - Touch-optimized accessibility
 """
 
+from dataclasses import dataclass
+
 # =============================================================================
 # IMPORT DESIGN TOKENS (Single Source of Truth)
 # =============================================================================
@@ -27,16 +29,23 @@ DEBOUNCE_DELAY_MS = 300      # Prevent rage clicks
 # =============================================================================
 # CONTENT ASSETS
 # =============================================================================
-CONCRETE_ITEMS = [
-    {'name': 'apples', 'emoji': '🍎'},
-    {'name': 'stars', 'emoji': '⭐'},
-    {'name': 'cats', 'emoji': '🐱'},
-    {'name': 'cars', 'emoji': '🚗'},
-    {'name': 'ducks', 'emoji': '🦆'},
-    {'name': 'fish', 'emoji': '🐟'},
-    {'name': 'flowers', 'emoji': '🌸'},
-    {'name': 'hearts', 'emoji': '❤️'},
-]
+@dataclass(frozen=True, slots=True)
+class ConcreteItem:
+    """A countable object shown in problems."""
+    name: str
+    emoji: str
+
+
+CONCRETE_ITEMS: tuple[ConcreteItem, ...] = (
+    ConcreteItem('apples', '🍎'),
+    ConcreteItem('stars', '⭐'),
+    ConcreteItem('cats', '🐱'),
+    ConcreteItem('cars', '🚗'),
+    ConcreteItem('ducks', '🦆'),
+    ConcreteItem('fish', '🐟'),
+    ConcreteItem('flowers', '🌸'),
+    ConcreteItem('hearts', '❤️'),
+)
 
 # =============================================================================
 # ECONOMY
@@ -53,5 +62,9 @@ VOLUME_MUSIC = 0.3
 VOLUME_MUSIC_DUCKED = 0.1
 VOLUME_VOICE = 1.0
 SFX_CACHE_MAX = 20
+SFX_POLYPHONY = 3            # Overlapping plays per effect (rage-tap safe)
+TTS_CACHE_MAX_FILES = 200
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+TTS_CACHE_SWEEP_MS = 30_000
 
 
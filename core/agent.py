@@ -19,11 +19,15 @@ Also implements Vygotsky's Zone of Proximal Development:
 
 import random
 import asyncio
+import importlib.util
 import logging
-import tempfile
 import os
-import subprocess
-from threading import Thread
+import tempfile
+import time
+from collections import deque
+from itertools import chain
+from threading import Event, Thread
+from typing import Iterable
 import sys
 
 logger = logging.getLogger(__name__)
@@ -44,21 +48,216 @@ except ImportError:
     VOICE_TYPE = 'pyttsx3'
     VOICE_NAME = None
 
-# Conditional imports based on voice type
+# TTS engines and QtMultimedia are imported on first use: edge-tts pulls in
+# aiohttp/ssl/certifi and QtMultimedia scans backend plugins, neither of
+# which should cost anything at startup.
 EDGE_TTS_AVAILABLE = False
 if VOICE_TYPE == 'edge-tts':
+    EDGE_TTS_AVAILABLE = importlib.util.find_spec("edge_tts") is not None
+    if not EDGE_TTS_AVAILABLE:
+        logger.info("edge-tts not installed, falling back to pyttsx3")
+
+from PySide6.QtCore import QObject, QThread, QUrl, Signal, Slot
+
+from core.audio_cache import AudioCacheManager
+
+# Gentle check-ins for an inactive child (module-level so they can be pre-synthesized)
+IDLE_PROMPTS = (
+    "I'm here whenever you're ready!",
+    "I wonder what you're thinking about?",
+    "Take your time! There's no rush.",
+    "I can help if you'd like!",
+)
+
+# Max concurrent edge-tts requests while warming the cache
+WARM_CACHE_CONCURRENCY = 4
+
+# Same phrase requested again within this window is dropped (rage-tap guard)
+SPEAK_THROTTLE_S = 1.0
+
+# Upper bound on how long speak(block=True) waits for a clip to finish
+BLOCKING_PLAYBACK_TIMEOUT_S = 60.0
+
+
+# Retry messages for a wrong count, keyed by how the drawing missed
+CLOSE_MESSAGE = "So close! You drew {drawn} and we needed {expected}. Let's try once more!"
+OVER_MESSAGE = "Wow, you drew {drawn}! That's more than {expected}. Can you try with fewer?"
+UNDER_MESSAGE = "I see {drawn} things. We need {expected}. Keep going, you can add more!"
+
+
+def _retry_message(expected: int, drawn: int) -> str:
+    if abs(drawn - expected) == 1:
+        template = CLOSE_MESSAGE
+    elif drawn > expected:
+        template = OVER_MESSAGE
+    else:
+        template = UNDER_MESSAGE
+    return template.format(drawn=drawn, expected=expected)
+
+
+# Pre-rendered for the Year 1 answer range (0-20); a wrong answer is a dict lookup
+RETRY_MESSAGES = {
+    (expected, drawn): _retry_message(expected, drawn)
+    for expected in range(21)
+    for drawn in range(21)
+    if expected != drawn
+}
+
+
+def get_warm_phrases() -> list[str]:
+    """All fixed phrases the agent may speak (feedback lines + idle prompts)."""
+    return list(chain.from_iterable(FEEDBACK.values())) + list(IDLE_PROMPTS)
+
+
+class _SpeechPlayer(QObject):
+    """
+    In-process player for cached TTS files.
+    
+    speak() runs on worker threads, so requests arrive as signals and are
+    queued onto the Qt thread that owns the QMediaPlayer.
+    """
+    
+    play_requested = Signal(str)
+    stop_requested = Signal()
+    
+    def __init__(self):
+        from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+        super().__init__()
+        self._player = QMediaPlayer()
+        self._output = QAudioOutput()
+        self._player.setAudioOutput(self._output)
+        self._output.setVolume(1.0)
+        self._current_source: str | None = None
+        # Cleared while a play_blocking() caller waits for the clip to end
+        self._done = Event()
+        self._done.set()
+        self._end_statuses = (QMediaPlayer.MediaStatus.EndOfMedia, QMediaPlayer.MediaStatus.InvalidMedia)
+        self.play_requested.connect(self._play)
+        self.stop_requested.connect(self._stop)
+        self._player.mediaStatusChanged.connect(self._on_status_changed)
+    
+    def play(self, path: str) -> None:
+        self.play_requested.emit(path)
+    
+    def play_blocking(self, path: str, timeout: float) -> None:
+        """Play and wait for the clip to end (or be stopped)."""
+        if QThread.currentThread() == self.thread():
+            # Waiting here would block the event loop that reports the end
+            self.play(path)
+            return
+        self._done.clear()
+        self.play(path)
+        self._done.wait(timeout)
+    
+    def stop(self) -> None:
+        self.stop_requested.emit()
+    
+    @Slot()
+    def _stop(self):
+        self._player.stop()
+        self._done.set()
+    
+    def _on_status_changed(self, status):
+        if status in self._end_statuses:
+            self._done.set()
+    
+    @Slot(str)
+    def _play(self, path: str):
+        if path != self._current_source:
+            self._player.setSource(QUrl.fromLocalFile(path))
+            self._current_source = path
+        else:
+            # Same phrase again: rewind instead of rebuilding the media pipeline
+            self._player.stop()
+            self._player.setPosition(0)
+        self._player.play()
+
+
+class _WinMMSpeechPlayer:
+    """
+    Fallback player for Windows when QtMultimedia is unavailable.
+    
+    Drives the MCI string interface in winmm.dll directly: no subprocess,
+    and MCI decodes MP3 itself so cached files need no conversion. MCI
+    devices are tied to the opening thread, so every command runs on the
+    TTS event loop.
+    """
+    
+    ALIAS = "math_omni_tts"
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        import ctypes
+        self._send_string = ctypes.WinDLL("winmm").mciSendStringW
+        self._loop = loop
+        self._is_open = False
+    
+    def play(self, path: str) -> None:
+        self._loop.call_soon_threadsafe(self._play, path)
+    
+    def play_blocking(self, path: str, timeout: float) -> None:
+        """Play and wait for the clip to end (call from outside the TTS loop)."""
+        self.play(path)
+        # Scheduled after _play on the same loop, so it sees the open device
+        future = asyncio.run_coroutine_threadsafe(self._wait_done(), self._loop)
+        try:
+            future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+    
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._close)
+    
+    async def _wait_done(self) -> None:
+        """Poll the device mode until playback stops or the device closes."""
+        import ctypes
+        mode = ctypes.create_unicode_buffer(32)
+        while self._is_open:
+            if self._send_string(f"status {self.ALIAS} mode", mode, len(mode), None):
+                return
+            if mode.value != "playing":
+                return
+            await asyncio.sleep(0.1)
+    
+    def _send(self, command: str) -> bool:
+        error = self._send_string(command, None, 0, None)
+        if error:
+            logger.warning("MCI command failed (%d): %s", error, command)
+        return error == 0
+    
+    def _play(self, path: str) -> None:
+        self._close()
+        if self._send(f'open "{path}" type mpegvideo alias {self.ALIAS}'):
+            self._is_open = True
+            self._send(f"play {self.ALIAS}")
+    
+    def _close(self) -> None:
+        if self._is_open:
+            self._send(f"close {self.ALIAS}")
+            self._is_open = False
+
+
+def _create_speech_player(loop: asyncio.AbstractEventLoop):
+    """Qt playback when QtMultimedia loads, else winmm on Windows."""
     try:
-        import edge_tts
-        EDGE_TTS_AVAILABLE = True
+        return _SpeechPlayer()
     except ImportError:
-        logger.info("edge-tts not installed, falling back to pyttsx3")
+        # QtMultimedia needs a platform backend plugin
+        if sys.platform != 'win32':
+            raise
+        logger.info("QtMultimedia unavailable, TTS playback falls back to winmm")
+        return _WinMMSpeechPlayer(loop)
+
+
+def _new_tts_loop() -> asyncio.AbstractEventLoop:
+    """Event loop for the TTS thread: uvloop where installed, else asyncio's."""
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            return uvloop.new_event_loop()
+        except ImportError:
+            pass
+    return asyncio.new_event_loop()
 
-# We use pyttsx3 as a fallback or if explicitly requested
-try:
-    import pyttsx3
-except ImportError:
-    if not EDGE_TTS_AVAILABLE:
-        logger.critical("No TTS engine available (install pyttsx3 or edge-tts)")
 
 class PedagogicalAgent:
     """
@@ -70,16 +269,48 @@ class PedagogicalAgent:
         self.attempt_count = 0
         self.consecutive_errors = 0
         
+        # Shuffle bags per feedback bucket (no back-to-back repeats)
+        self._bags: dict[str, deque[str]] = {}
+        self._last_drawn: dict[str, str] = {}
+        
         # Initialize TTS engine based on config
+        self._player = None
         if EDGE_TTS_AVAILABLE:
+            self._loop = _new_tts_loop()
+            try:
+                # Qt playback must be created on the UI thread
+                self._player = _create_speech_player(self._loop)
+            except ImportError as e:
+                logger.warning("No playback backend for edge-tts: %s", e)
+                self._loop.close()
+
+        if self._player is not None:
             self.voice_type = 'edge-tts'
             self.voice_name = VOICE_NAME
-            self._temp_audio_file = os.path.join(tempfile.gettempdir(), "math_omni_speech.mp3")
+            self.cache = AudioCacheManager()
+            # (text, voice) -> synthesis running on the TTS loop, so concurrent
+            # requests for one phrase share a single edge-tts call
+            self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+            # Long-lived event loop for edge-tts (avoids asyncio.run per phrase)
+            loop_thread = Thread(target=self._loop.run_forever, daemon=True)
+            loop_thread.start()
+
+            # Single consumer for non-blocking speech; stale requests coalesce
+            self._speak_queue: asyncio.Queue[str] = asyncio.Queue()
+            self._last_spoken: str | None = None
+            self._last_spoken_ts = 0.0
+            asyncio.run_coroutine_threadsafe(self._speak_worker(), self._loop)
         else:
+            # pyttsx3 is the fallback or an explicit choice
             self.voice_type = 'pyttsx3'
             try:
+                import pyttsx3
                 self.engine = pyttsx3.init()
                 self._configure_pyttsx3_voice()
+            except ImportError:
+                logger.critical("No TTS engine available (install pyttsx3 or edge-tts)")
+                self.engine = None
             except Exception as e:
                 logger.exception("Failed to init pyttsx3: %s", e)
                 self.engine = None
@@ -95,9 +326,18 @@ class PedagogicalAgent:
                 break
     
     def speak(self, text: str, block: bool = False):
-        """Speak the given text."""
+        """
+        Speak the given text.
+
+        block=True returns once playback has finished. With edge-tts on Qt
+        playback that wait is only possible off the UI thread; called from
+        the UI thread it returns once the clip has started.
+        """
         if block:
             self._speak_sync(text)
+        elif self.voice_type == 'edge-tts':
+            # Queue.put_nowait is not thread-safe; hand off to the TTS loop
+            self._loop.call_soon_threadsafe(self._speak_queue.put_nowait, text)
         else:
             thread = Thread(target=self._speak_sync, args=(text,))
             thread.daemon = True
@@ -111,37 +351,173 @@ class PedagogicalAgent:
             self.engine.say(text)
             self.engine.runAndWait()
     
-    def _speak_edge_tts(self, text: str):
-        """Generate and play speech using edge-tts."""
-        async def generate_audio():
+    async def _synthesize(self, text: str) -> None:
+        """Synthesize a phrase to the cache (atomic rename so partial files never hit)."""
+        path = self.cache.get_path(text, self.voice_name)
+        # Unique temp name: a stray concurrent save can never share a file
+        fd, partial = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        os.close(fd)
+        import edge_tts
+        try:
             communicate = edge_tts.Communicate(text, self.voice_name)
-            await communicate.save(self._temp_audio_file)
+            await communicate.save(partial)
+            os.replace(partial, path)
+        except BaseException:
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+            raise
+        self.cache.mark_existing(text, self.voice_name)
+
+    def _synthesis_task(self, text: str) -> asyncio.Task:
+        """Return the running synthesis for a phrase, starting one if needed (TTS loop only)."""
+        key = (text, self.voice_name)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._loop.create_task(self._synthesize(text))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _prepare_audio(self, text: str):
+        """Return the cached audio path for a phrase, synthesizing on a miss."""
+        if self.cache.has(text, self.voice_name):
+            self.cache.touch(text, self.voice_name)
+        else:
+            # shield: one waiter giving up must not cancel the others
+            await asyncio.shield(self._synthesis_task(text))
+        return self.cache.get_path(text, self.voice_name)
+
+    async def _speak_worker(self) -> None:
+        """
+        Consume queued speech requests on the TTS loop.
         
+        Only the most recent pending request is spoken (anything older
+        would be interrupted anyway), and an immediate repeat of the
+        phrase just played is dropped.
+        """
+        while True:
+            text = await self._speak_queue.get()
+            while not self._speak_queue.empty():
+                text = self._speak_queue.get_nowait()
+
+            if (text == self._last_spoken
+                    and time.monotonic() - self._last_spoken_ts < SPEAK_THROTTLE_S):
+                continue
+
+            try:
+                audio_path = await self._prepare_audio(text)
+            except Exception as e:
+                logger.exception("edge-tts synthesis error: %s", e)
+                continue
+
+            self._last_spoken = text
+            self._last_spoken_ts = time.monotonic()
+            self._player.play(str(audio_path))
+
+    async def warm_cache(self, phrases: Iterable[str]) -> int:
+        """
+        Pre-synthesize fixed phrases so later speech is a cache hit.
+        Returns the number of phrases newly synthesized.
+        """
+        if self.voice_type != 'edge-tts':
+            return 0
+
+        semaphore = asyncio.Semaphore(WARM_CACHE_CONCURRENCY)
+
+        async def fetch(text: str) -> bool:
+            if self.cache.has(text, self.voice_name):
+                return False
+            async with semaphore:
+                # Re-check: speech may have synthesized it while we waited
+                if self.cache.has(text, self.voice_name):
+                    return False
+                started = (text, self.voice_name) not in self._inflight
+                try:
+                    await asyncio.shield(self._synthesis_task(text))
+                    return started
+                except Exception as e:
+                    logger.warning("Cache warm failed for %r: %s", text, e)
+                    return False
+
+        # dict.fromkeys: de-duplicate while keeping order
+        results = await asyncio.gather(*(fetch(t) for t in dict.fromkeys(phrases)))
+        synthesized = sum(results)
+        logger.info("TTS cache warmed: %d new phrases", synthesized)
+        return synthesized
+
+    def warm_cache_in_background(self) -> None:
+        """Warm the TTS cache for all fixed phrases without blocking the UI."""
+        if self.voice_type != 'edge-tts':
+            return
+        asyncio.run_coroutine_threadsafe(self.warm_cache(get_warm_phrases()), self._loop)
+
+    def prefetch(self, text: str) -> None:
+        """Synthesize a phrase in the background without playing it."""
+        if self.voice_type != 'edge-tts' or self.cache.has(text, self.voice_name):
+            return
+        self._loop.call_soon_threadsafe(self._start_prefetch, text)
+
+    def _start_prefetch(self, text: str) -> None:
+        """Register a prefetch in the in-flight map so a later speak() awaits it."""
+        if self.cache.has(text, self.voice_name):
+            return
+        task = self._synthesis_task(text)
+        task.add_done_callback(self._log_prefetch_failure)
+
+    @staticmethod
+    def _log_prefetch_failure(task: asyncio.Task) -> None:
+        """Surface errors from a prefetch nobody else ended up awaiting."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("TTS prefetch failed: %s", task.exception())
+
+    def enforce_cache_limits(self) -> None:
+        """
+        Trim the TTS cache to its size caps (call periodically, off the speak path).
+        The unlinks run on the TTS loop so a large eviction never stalls the UI.
+        """
+        if self.voice_type == 'edge-tts':
+            self._loop.call_soon_threadsafe(self.cache.enforce_limits)
+
+    def _speak_edge_tts(self, text: str):
+        """Generate (or reuse cached) speech, play it and wait for it to finish."""
         try:
-            asyncio.run(generate_audio())
-            # Play using powershell to play the mp3 file
-            subprocess.run(
-                ['powershell', '-c', 
-                 f'Add-Type -AssemblyName presentationCore; ' +
-                 f'$player = New-Object System.Windows.Media.MediaPlayer; ' +
-                 f'$player.Open("{self._temp_audio_file}"); ' +
-                 f'$player.Play(); Start-Sleep -Seconds 10'],
-                capture_output=True,
-                timeout=30
-            )
+            future = asyncio.run_coroutine_threadsafe(self._prepare_audio(text), self._loop)
+            audio_path = future.result(timeout=30)
+            self._player.play_blocking(str(audio_path), BLOCKING_PLAYBACK_TIMEOUT_S)
         except Exception as e:
             logger.exception("edge-tts playback error: %s", e)
-        
-        if self._temp_audio_file and os.path.exists(self._temp_audio_file):
-            try:
-                os.remove(self._temp_audio_file)
-            except OSError:
-                pass
     
     def stop(self):
         """Stop any currently playing speech."""
-        if self.voice_type != 'edge-tts' and self.engine:
+        if self.voice_type == 'edge-tts':
+            self._player.stop()
+        elif self.engine:
             self.engine.stop()
+
+    def shutdown(self):
+        """Release the TTS event loop."""
+        if self.voice_type != 'edge-tts':
+            return
+        self._player.stop()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    def _draw(self, bucket: str, phrases) -> str:
+        """
+        Draw the next phrase from a shuffled bag, refilling when empty.
+        Every phrase is heard once before any repeats.
+        """
+        bag = self._bags.setdefault(bucket, deque())
+        if not bag:
+            last = self._last_drawn.get(bucket)
+            bag.extend(random.sample(phrases, len(phrases)))
+            # Avoid a repeat across the refill boundary
+            if len(bag) > 1 and bag[0] == last:
+                bag.rotate(-1)
+        phrase = bag.popleft()
+        self._last_drawn[bucket] = phrase
+        return phrase
     
     def reset_for_new_problem(self):
         """Reset tracking for a new problem."""
@@ -150,18 +526,18 @@ class PedagogicalAgent:
     
     def get_effort_feedback(self) -> str:
         """Return feedback acknowledging the child's effort."""
-        return random.choice(FEEDBACK.get('effort_acknowledged', ["Great effort!"]))
+        return self._draw('effort_acknowledged', FEEDBACK.get('effort_acknowledged') or ["Great effort!"])
     
     def get_success_feedback(self) -> str:
         """Return celebration feedback for correct answer."""
         self.consecutive_errors = 0
-        return random.choice(FEEDBACK.get('success_specific', ["Well done!"]))
+        return self._draw('success_specific', FEEDBACK.get('success_specific') or ["Well done!"])
     
     def get_gentle_redirect(self) -> str:
         """Return feedback for incorrect answer that encourages retry."""
         self.attempt_count += 1
         self.consecutive_errors += 1
-        return random.choice(FEEDBACK.get('gentle_redirect', ["Let's try again!"]))
+        return self._draw('gentle_redirect', FEEDBACK.get('gentle_redirect') or ["Let's try again!"])
     
     def should_offer_scaffolding(self) -> bool:
         """Determine if we should offer additional support."""
@@ -169,17 +545,11 @@ class PedagogicalAgent:
     
     def get_scaffolding_offer(self) -> str:
         """Return an offer to help."""
-        return random.choice(FEEDBACK.get('scaffolding_offer', ["Would you like some help?"]))
+        return self._draw('scaffolding_offer', FEEDBACK.get('scaffolding_offer') or ["Would you like some help?"])
     
     def get_idle_prompt(self) -> str:
         """Return a gentle prompt for an inactive child."""
-        prompts = [
-            "I'm here whenever you're ready!",
-            "I wonder what you're thinking about?",
-            "Take your time! There's no rush.",
-            "I can help if you'd like!",
-        ]
-        return random.choice(prompts)
+        return self._draw('idle', IDLE_PROMPTS)
     
     def evaluate_answer(self, expected: int, drawn: int) -> tuple:
         """Evaluate the child's drawn answer."""
@@ -189,9 +559,7 @@ class PedagogicalAgent:
         self.attempt_count += 1
         self.consecutive_errors += 1
         
-        if abs(drawn - expected) == 1:
-            return (False, f"So close! You drew {drawn} and we needed {expected}. Let's try once more!")
-        elif drawn > expected:
-            return (False, f"Wow, you drew {drawn}! That's more than {expected}. Can you try with fewer?")
-        else:
-            return (False, f"I see {drawn} things. We need {expected}. Keep going, you can add more!")
+        message = RETRY_MESSAGES.get((expected, drawn))
+        if message is None:
+            message = _retry_message(expected, drawn)
+        return (False, message)
@@ -0,0 +1,178 @@
+"""
+Audio Cache - On-disk store for synthesized TTS phrases.
+
+Maps (text, voice) pairs to stable MP3 paths so that repeated phrases
+skip the edge-tts network round-trip and MP3 encode entirely.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+
+from config import TTS_CACHE_MAX_FILES, TTS_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(tempfile.gettempdir()) / "math_omni_tts"
+INDEX_NAME = "index.json"
+
+
+class AudioCacheManager:
+    """
+    Resolves cache paths for synthesized speech.
+
+    Lookups are memoized in memory so repeated phrases skip both the
+    hash computation and the existence stat() on the hot path.
+    Eviction is least-recently-used: touch() moves a hit to the back.
+    Size accounting is incremental: the index is loaded once at
+    construction (from the index.json sidecar when it is still in sync,
+    otherwise by a directory scan), after which writes and evictions
+    update running totals and rewrite the sidecar.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        max_files: int = TTS_CACHE_MAX_FILES,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_files = max_files
+        self._max_bytes = max_bytes
+        # (text, voice) -> (path, exists on disk)
+        self._lut: dict[tuple[str, str | None], tuple[Path, bool]] = {}
+        # Oldest first: path -> size in bytes
+        self._files: OrderedDict[Path, int] = OrderedDict()
+        self._total_size = 0
+        self._lock = Lock()  # Writes come from the TTS thread, sweeps from the UI
+        self._index_path = self.cache_dir / INDEX_NAME
+        if not self._load_index():
+            self._scan()
+            self._save_index()
+
+    def _load_index(self) -> bool:
+        """
+        Load the sidecar index. Returns False if it is missing, corrupt, or
+        out of sync with the directory listing (one listdir, no stats).
+        """
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            entries = [(str(name), int(size)) for name, size in data["files"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        on_disk = {name for name in os.listdir(self.cache_dir) if name.endswith(".mp3")}
+        if on_disk != {name for name, _ in entries}:
+            return False
+
+        for name, size in entries:
+            self._files[self.cache_dir / name] = size
+            self._total_size += size
+        return True
+
+    def _save_index(self) -> None:
+        """Write the sidecar index atomically (caller holds the lock or is __init__)."""
+        data = {"files": [[path.name, size] for path, size in self._files.items()]}
+        tmp = self._index_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            logger.warning("Could not write TTS cache index: %s", e)
+
+    def _scan(self) -> None:
+        """Index existing cache files, oldest access first."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".mp3"):
+                    continue
+                try:
+                    # DirEntry caches the stat; no symlink follow needed in our own dir
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue  # Removed mid-scan
+                entries.append((st.st_atime, entry.path, st.st_size))
+        for _, path, size in sorted(entries):
+            self._files[Path(path)] = size
+            self._total_size += size
+
+    def _lookup(self, text: str, voice: str | None) -> tuple[Path, bool]:
+        key = (text, voice)
+        entry = self._lut.get(key)
+        if entry is None:
+            # BLAKE2b: faster than MD5 for short keys; only a filename, not security.
+            # NUL separator so ("ab", "c") and ("a", "bc") cannot collide; files
+            # named under the old key are never hit again and age out via LRU.
+            key_bytes = f"{text}\x00{voice}".encode("utf-8")
+            text_hash = hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+            path = self.cache_dir / f"{text_hash}.mp3"
+            entry = (path, path in self._files)
+            self._lut[key] = entry
+        return entry
+
+    def get_path(self, text: str, voice: str | None) -> Path:
+        """Return the cache file path for a phrase spoken by a voice."""
+        return self._lookup(text, voice)[0]
+
+    def has(self, text: str, voice: str | None) -> bool:
+        """Check whether a phrase has already been synthesized."""
+        return self._lookup(text, voice)[1]
+
+    def mark_existing(self, text: str, voice: str | None) -> None:
+        """Record that a phrase has just been written to the cache."""
+        path = self.get_path(text, voice)
+        size = path.stat().st_size
+        with self._lock:
+            self._total_size += size - self._files.pop(path, 0)
+            self._files[path] = size
+            self._lut[(text, voice)] = (path, True)
+            self._save_index()
+
+    def touch(self, text: str, voice: str | None) -> None:
+        """
+        Mark a cached phrase as just used so eviction keeps it longest.
+        The new order reaches index.json with the next write or eviction.
+        """
+        path = self.get_path(text, voice)
+        with self._lock:
+            if path in self._files:
+                self._files.move_to_end(path)
+
+    @property
+    def total_size(self) -> int:
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def enforce_limits(self) -> int:
+        """
+        Evict oldest entries until under the file-count and byte caps.
+        Returns the number of files removed.
+        """
+        evicted = 0
+        with self._lock:
+            while self._files and (
+                len(self._files) > self._max_files or self._total_size > self._max_bytes
+            ):
+                path, size = self._files.popitem(last=False)
+                self._total_size -= size
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError as e:
+                    # Likely still open by the player; the next startup scan re-indexes it
+                    logger.debug("Could not evict %s: %s", path, e)
+                evicted += 1
+            if evicted:
+                # Drop stale memo entries for evicted files
+                self._lut = {k: v for k, v in self._lut.items() if v[0] in self._files or not v[1]}
+                self._save_index()
+        if evicted:
+            logger.info("TTS cache evicted %d files", evicted)
+        return evicted
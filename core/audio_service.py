@@ -13,13 +13,13 @@ import logging
 import os
 from typing import Optional, Callable
 from pathlib import Path
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QSoundEffect
 from PySide6.QtCore import QUrl, QObject, QTimer
 
-from core.sfx import get_sfx_path
-from config import VOLUME_SFX, VOLUME_MUSIC, VOLUME_MUSIC_DUCKED, SFX_CACHE_MAX
+from core.sfx import SFX_NAMES, get_sfx_path
+from config import VOLUME_SFX, VOLUME_MUSIC, VOLUME_MUSIC_DUCKED, SFX_CACHE_MAX, SFX_POLYPHONY
 
 
 logger = logging.getLogger(__name__)
@@ -30,21 +30,21 @@ class SFXCache:
     LRU cache for SFX to prevent memory leaks.
     
     ChatGPT 5.2 Fix: Added logging for missing SFX files.
+    
+    Each name holds a small ring of identical QSoundEffect instances that
+    are handed out round-robin, so rapid repeated taps overlap instead of
+    cutting each other off (a single QSoundEffect is not polyphonic).
     """
     
-    def __init__(self, max_size: int = SFX_CACHE_MAX):
-        self._cache: OrderedDict[str, QSoundEffect] = OrderedDict()
+    def __init__(self, max_size: int = SFX_CACHE_MAX, voices: int = SFX_POLYPHONY):
+        self._cache: OrderedDict[str, list[QSoundEffect]] = OrderedDict()
+        self._cursor: dict[str, int] = defaultdict(int)
         self._max_size = max_size
+        self._voices = voices
         self._missing_logged: set[str] = set()  # ChatGPT 5.2 Fix: Track logged missing SFX
     
-    def get(self, name: str) -> Optional[QSoundEffect]:
-        if name in self._cache:
-            # Move to end (most recently used)
-            effect = self._cache.pop(name)
-            self._cache[name] = effect
-            return effect
-        
-        # Load new effect
+    def _load(self, name: str) -> Optional[list[QSoundEffect]]:
+        """Create the effect ring for a name, or None if the file is missing."""
         path = get_sfx_path(name)
         if not path or not os.path.exists(path):
             # ChatGPT 5.2 Fix: Log missing SFX once per name to avoid spam
@@ -53,20 +53,47 @@ class SFXCache:
                 self._missing_logged.add(name)
             return None
         
-        effect = QSoundEffect()
-        effect.setSource(QUrl.fromLocalFile(path))
-        effect.setVolume(VOLUME_SFX)
+        url = QUrl.fromLocalFile(path)
+        ring = []
+        for _ in range(self._voices):
+            effect = QSoundEffect()
+            effect.setSource(url)
+            effect.setVolume(VOLUME_SFX)
+            ring.append(effect)
         
-        self._cache[name] = effect
+        self._cache[name] = ring
         
         # Enforce size limit
         if len(self._cache) > self._max_size:
-            _, old_effect = self._cache.popitem(last=False)
-            old_effect.stop()
-            old_effect.deleteLater()
+            old_name, old_ring = self._cache.popitem(last=False)
+            self._cursor.pop(old_name, None)
+            for old_effect in old_ring:
+                old_effect.stop()
+                old_effect.deleteLater()
+        
+        return ring
+    
+    def get(self, name: str) -> Optional[QSoundEffect]:
+        ring = self._cache.get(name)
+        if ring is not None:
+            # Mark most recently used (O(1) splice, no pop/reinsert)
+            self._cache.move_to_end(name)
+        else:
+            ring = self._load(name)
+            if ring is None:
+                return None
         
+        # Round-robin through the ring so overlapping plays mix
+        effect = ring[self._cursor[name] % len(ring)]
+        self._cursor[name] += 1
         return effect
 
+    def preload(self, names) -> None:
+        """Load effects ahead of first use so the first tap doesn't stutter."""
+        for name in names:
+            if name not in self._cache:
+                self._load(name)
+
 
 class AudioService(QObject):
     """
@@ -84,6 +111,9 @@ class AudioService(QObject):
         
         # SFX Channel (LRU cached for low latency)
         self._sfx_cache = SFXCache()
+        # Decode the fixed SFX set on the first event-loop turn: off the
+        # construction path, but well before the first click
+        QTimer.singleShot(0, lambda: self._sfx_cache.preload(SFX_NAMES))
         
         # Optional voice stop callback (provided by VoiceBank)
         self._voice_stop_callback: Optional[Callable[[], None]] = None
@@ -22,6 +22,19 @@ DB_PATH = os.path.join("data", "math_omni.db")
 
 T = TypeVar('T')
 
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS economy (
+        id INTEGER PRIMARY KEY,
+        balance INTEGER DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS progress (
+        level_id INTEGER PRIMARY KEY,
+        stars INTEGER DEFAULT 0,
+        completed BOOLEAN DEFAULT 0
+    );
+    INSERT OR IGNORE INTO economy (id, balance) VALUES (1, 0);
+"""
+
 
 class DatabaseService:
     """Async database for the egg economy and progress tracking."""
@@ -78,30 +91,8 @@ class DatabaseService:
         """Create tables if they don't exist."""
         db = await self._ensure_connected()
 
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS economy (
-                id INTEGER PRIMARY KEY,
-                balance INTEGER DEFAULT 0
-            )
-        """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS progress (
-                level_id INTEGER PRIMARY KEY,
-                stars INTEGER DEFAULT 0,
-                completed BOOLEAN DEFAULT 0
-            )
-        """)
-
-        # Init wallet if empty
-        cursor = await db.execute("SELECT count(*) FROM economy")
-        try:
-            count = await cursor.fetchone()
-        finally:
-            await cursor.close()
-        if count and count[0] == 0:
-            await db.execute("INSERT INTO economy (id, balance) VALUES (1, 0)")
-
-        await db.commit()
+        # One script, one round trip: schema plus the wallet row (autocommits)
+        await db.executescript(SCHEMA)
 
     async def get_eggs(self) -> int:
         """Get current egg balance."""
@@ -123,10 +114,13 @@ class DatabaseService:
         
         async with self._write_lock:
             async def op():
-                # Ensure wallet row exists even if DB file was replaced/corrupted
-                await db.execute("INSERT OR IGNORE INTO economy (id, balance) VALUES (1, 0)")
-                await db.execute("UPDATE economy SET balance = balance + ? WHERE id=1", (amount,))
-                cursor = await db.execute("SELECT balance FROM economy WHERE id=1")
+                # Upsert so the wallet row exists even if the DB file was
+                # replaced/corrupted; RETURNING hands back the new balance
+                cursor = await db.execute("""
+                    INSERT INTO economy (id, balance) VALUES (1, ?)
+                    ON CONFLICT(id) DO UPDATE SET balance = balance + excluded.balance
+                    RETURNING balance
+                """, (amount,))
                 try:
                     row = await cursor.fetchone()
                 finally:
@@ -141,9 +135,9 @@ class DatabaseService:
                 logger.exception("add_eggs failed")
                 return 0
 
-    async def unlock_level(self, level_id: int):
+    async def unlock_level(self, level_id: int) -> bool:
         """
-        Mark a level as completed.
+        Mark a level as completed. Returns False if the write failed.
         
         ChatGPT 5.2 Fix: Serialized with write lock.
         """
@@ -159,8 +153,10 @@ class DatabaseService:
             
             try:
                 await self._retry_locked(op)
+                return True
             except Exception:
                 logger.exception("unlock_level failed for level %d", level_id)
+                return False
     
     async def get_unlocked_level(self) -> int:
         """Returns the maximum unlocked level ID + 1 (next available)."""
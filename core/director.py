@@ -10,7 +10,7 @@ FIXES APPLIED (Z.ai Review):
 """
 import logging
 from enum import Enum, auto
-from typing import Dict, List
+from typing import Dict, FrozenSet
 
 from PySide6.QtCore import QObject, Signal, Slot, QTimer
 
@@ -41,12 +41,13 @@ class Director(QObject):
     
     # Valid state transitions (Z.ai fix #1)
     # Updated: Added TUTOR_SPEAKING to IDLE transitions for welcome/announcements
-    _VALID_TRANSITIONS: Dict[AppState, List[AppState]] = {
-        AppState.IDLE: [AppState.INPUT_ACTIVE, AppState.TUTOR_SPEAKING],
-        AppState.INPUT_ACTIVE: [AppState.EVALUATING, AppState.IDLE],
-        AppState.EVALUATING: [AppState.INPUT_ACTIVE, AppState.CELEBRATION, AppState.TUTOR_SPEAKING],
-        AppState.TUTOR_SPEAKING: [AppState.INPUT_ACTIVE, AppState.IDLE, AppState.CELEBRATION],
-        AppState.CELEBRATION: [AppState.INPUT_ACTIVE, AppState.IDLE],
+    # frozensets: O(1) hashed membership on every transition check
+    _VALID_TRANSITIONS: Dict[AppState, FrozenSet[AppState]] = {
+        AppState.IDLE: frozenset({AppState.INPUT_ACTIVE, AppState.TUTOR_SPEAKING}),
+        AppState.INPUT_ACTIVE: frozenset({AppState.EVALUATING, AppState.IDLE}),
+        AppState.EVALUATING: frozenset({AppState.INPUT_ACTIVE, AppState.CELEBRATION, AppState.TUTOR_SPEAKING}),
+        AppState.TUTOR_SPEAKING: frozenset({AppState.INPUT_ACTIVE, AppState.IDLE, AppState.CELEBRATION}),
+        AppState.CELEBRATION: frozenset({AppState.INPUT_ACTIVE, AppState.IDLE}),
     }
     
     # Timeout for TUTOR_SPEAKING state (ms)
@@ -57,6 +58,7 @@ class Director(QObject):
         self.container = container
         self._current_state = AppState.IDLE
         self._is_transitioning = False  # Z.ai fix #2
+        self._audio = None  # Resolved on first use (see _duck_music)
         
         # Watchdog timer for TUTOR_SPEAKING (Z.ai fix #3)
         self._tutor_watchdog = QTimer(self)
@@ -82,12 +84,12 @@ class Director(QObject):
             logging.warning(f"[Director] Ignoring state request to {new_state} during transition")
             return
         
-        # Skip if same state
-        if self._current_state == new_state:
+        # Skip if same state (Enum members are singletons: identity check)
+        if self._current_state is new_state:
             return
         
         # Z.ai fix #1: Validate transition
-        valid_targets = self._VALID_TRANSITIONS.get(self._current_state, [])
+        valid_targets = self._VALID_TRANSITIONS.get(self._current_state, frozenset())
         if new_state not in valid_targets:
             logging.warning(f"[Director] Invalid transition: {self._current_state} -> {new_state}")
             return
@@ -101,11 +103,11 @@ class Director(QObject):
         self._tutor_watchdog.stop()
         
         # State-specific handlers
-        if new_state == AppState.TUTOR_SPEAKING:
+        if new_state is AppState.TUTOR_SPEAKING:
             self._handle_tutor_start()
-        elif new_state == AppState.INPUT_ACTIVE:
+        elif new_state is AppState.INPUT_ACTIVE:
             self._handle_input_active()
-        elif new_state == AppState.CELEBRATION:
+        elif new_state is AppState.CELEBRATION:
             self._handle_celebration_start()
         
         # Emit signal
@@ -116,28 +118,28 @@ class Director(QObject):
         
         logging.debug(f"[Director] {old_state.name} -> {new_state.name}")
 
+    def _duck_music(self, ducked: bool):
+        """Duck/restore music, resolving the audio service once (registered at startup)."""
+        try:
+            if self._audio is None:
+                from core.audio_service import AudioService
+                self._audio = self.container.resolve(AudioService)
+            self._audio.duck_music(ducked)
+        except Exception:
+            pass
+
     def _handle_tutor_start(self):
         """Called when entering TUTOR_SPEAKING state."""
         # Start watchdog timer (Z.ai fix #3)
         self._tutor_watchdog.start(self.TUTOR_TIMEOUT_MS)
         
         # Duck music audio
-        try:
-            from core.audio_service import AudioService
-            audio = self.container.resolve(AudioService)
-            audio.duck_music(True)
-        except Exception:
-            pass
+        self._duck_music(True)
 
     def _handle_input_active(self):
         """Called when entering INPUT_ACTIVE state."""
         # Restore music audio
-        try:
-            from core.audio_service import AudioService
-            audio = self.container.resolve(AudioService)
-            audio.duck_music(False)
-        except Exception:
-            pass
+        self._duck_music(False)
 
     def _handle_celebration_start(self):
         """Called when entering CELEBRATION state."""
@@ -149,7 +151,7 @@ class Director(QObject):
         Watchdog timeout for TUTOR_SPEAKING (Z.ai fix #3).
         Forces return to INPUT_ACTIVE if audio hangs.
         """
-        if self._current_state == AppState.TUTOR_SPEAKING:
+        if self._current_state is AppState.TUTOR_SPEAKING:
             logging.warning("[Director] Tutor speech timed out, forcing INPUT_ACTIVE")
             # Reset transitioning flag in case it's stuck
             self._is_transitioning = False
@@ -160,7 +162,7 @@ class Director(QObject):
         External skip request (e.g., from tap-to-skip overlay).
         Used during TUTOR_SPEAKING or CELEBRATION.
         """
-        if self._current_state in [AppState.TUTOR_SPEAKING, AppState.CELEBRATION]:
+        if self._current_state in (AppState.TUTOR_SPEAKING, AppState.CELEBRATION):
             logging.info(f"[Director] Skip requested from {self._current_state.name}")
             self._is_transitioning = False  # Allow transition
             self.set_state(AppState.INPUT_ACTIVE)
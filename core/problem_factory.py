@@ -25,6 +25,8 @@ class ProblemFactory:
             "subtraction": SubtractionStrategy(),
         }
         self._current_mode: str = "counting"
+        # Strategy for the current mode, so generate() skips the dict lookup
+        self._active_strategy: ProblemStrategy = self._strategies[self._current_mode]
 
     @property
     def current_mode(self) -> str:
@@ -34,6 +36,7 @@ class ProblemFactory:
         if mode not in self._strategies:
             raise ValueError(f"Unknown mode: {mode}")
         self._current_mode = mode
+        self._active_strategy = self._strategies[mode]
 
     def set_profile(self, profile):
         """Propagate profile to all strategies."""
@@ -51,12 +54,20 @@ class ProblemFactory:
         if not isinstance(strategy, ProblemStrategy):
             raise TypeError(f"Strategy must be a ProblemStrategy subclass, got {type(strategy)}")
         self._strategies[mode] = strategy
+        if mode == self._current_mode:
+            self._active_strategy = strategy
 
     def unregister_strategy(self, mode: str) -> bool:
-        """Remove a registered strategy. Returns True if removed."""
+        """Remove a registered strategy. Returns True if removed.
+
+        Unregistering the active mode falls back to counting.
+        """
         if mode in ("counting", "addition", "subtraction"):
             raise ValueError(f"Cannot unregister core strategy: {mode}")
-        return self._strategies.pop(mode, None) is not None
+        removed = self._strategies.pop(mode, None) is not None
+        if removed and mode == self._current_mode:
+            self.set_mode("counting")
+        return removed
     
     @property
     def available_modes(self) -> list[str]:
@@ -64,10 +75,11 @@ class ProblemFactory:
         return list(self._strategies.keys())
 
     def generate(self, difficulty: int, mode: str | None = None) -> ProblemData:
-        strategy_key = mode or self._current_mode
-        if strategy_key not in self._strategies:
-            raise ValueError(f"Unknown mode: {strategy_key}")
+        if not mode or mode == self._current_mode:
+            return self._active_strategy.generate(difficulty)
 
-        strategy = self._strategies[strategy_key]
+        strategy = self._strategies.get(mode)
+        if strategy is None:
+            raise ValueError(f"Unknown mode: {mode}")
         return strategy.generate(difficulty)
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import random
-
-from .base import ProblemData, ProblemStrategy
+from .base import FALLBACK_ITEMS, NUMBER_TOKENS, ProblemData, ProblemStrategy
 
 
 class AdditionStrategy(ProblemStrategy):
@@ -21,14 +19,14 @@ class AdditionStrategy(ProblemStrategy):
         else:
             # Fallback to random for higher difficulties
             max_sum = 5 if difficulty <= 3 else 10
-            a = random.randint(1, max_sum - 1)
-            b = random.randint(1, max_sum - a)
+            a = self._rng.randint(1, max_sum - 1)
+            b = self._rng.randint(1, max_sum - a)
             target = a + b
-            item = random.choice(["apples", "cats", "stars"])
+            item = self._rng.choice(FALLBACK_ITEMS)
             audio = [
-                f"numbers_{a:02d}",
+                NUMBER_TOKENS[a],
                 "op_plus",
-                f"numbers_{b:02d}",
+                NUMBER_TOKENS[b],
                 "op_equals",
                 "question_what_is",
             ]
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+# Item pool for procedural (non-curriculum) problems
+FALLBACK_ITEMS = ("apples", "cats", "stars")
 
-@dataclass
+# Voice-bank clip keys for spoken numbers 0-20, indexed by value
+NUMBER_TOKENS = tuple(f"numbers_{n:02d}" for n in range(21))
+
+
+@dataclass(slots=True)
 class ProblemData:
-    """Unified contract for any math problem."""
+    """Unified contract for any math problem (slotted: one per problem, read by attribute)."""
 
     correct_answer: int
     prompt_text: str
@@ -24,8 +31,13 @@ class ProblemData:
 class ProblemStrategy(ABC):
     """Strategy interface for generating math problems."""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Optional random seed for reproducible problems (options included)
+        """
         self.profile = None
+        self._rng = random.Random(seed)
 
     def set_profile(self, profile):
         """Inject student profile for adaptive difficulty."""
@@ -43,13 +55,12 @@ class ProblemStrategy(ABC):
         
         FIX: Previously only returned distractors. Now includes target answer.
         """
-        import random
         # Lazy import to avoid circular dependency
         from core.problems.distractor_generator import generate_addition_distractors
         
         # 1. Get base distractors (educationally sound)
         # Note: generate_addition_distractors returns [target, d1, d2]
-        base_set = generate_addition_distractors(target)
+        base_set = generate_addition_distractors(target, rng=self._rng)
         # Filter to exclude target AND respect min_val/max_val bounds
         distractors = [d for d in base_set if d != target and d >= min_val and d <= max_val]
         
@@ -69,16 +80,18 @@ class ProblemStrategy(ABC):
                         distractors[0] = err # Replace first distractor
                     break
         
-        # Ensure correct count of distractors
-        while len(distractors) < count:
-             d = random.randint(min_val, max_val)
-             if d != target and d not in distractors:
-                 distractors.append(d)
-                 
+        # Ensure correct count of distractors: sample the remaining valid
+        # values directly (no rejection loop, and no hang if the range is tiny)
+        if len(distractors) < count:
+            pool = [v for v in range(min_val, max_val + 1) if v != target and v not in distractors]
+            distractors += self._rng.sample(pool, min(count - len(distractors), len(pool)))
+
         # Trim to exactly 'count' distractors
         distractors = distractors[:count]
         
-        # FIX: Include target in options and shuffle
-        options = [target] + distractors
-        random.shuffle(options)
-        return options
+        # FIX: Include target and shuffle everything: the injected past mistake
+        # always sits first and sampled fill-ins always last, so no part of
+        # the order can be trusted as random
+        distractors.append(target)
+        self._rng.shuffle(distractors)
+        return distractors
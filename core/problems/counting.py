@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import random
-
 from config import CONCRETE_ITEMS
 from .base import ProblemData, ProblemStrategy
 
@@ -13,12 +11,12 @@ class CountingStrategy(ProblemStrategy):
         difficulty = max(0, difficulty)
         max_n = 3 + (difficulty * 2)
         max_n = min(max_n, 20)
-        target = random.randint(1, max_n)
-        item = random.choice(CONCRETE_ITEMS)
+        target = self._rng.randint(1, max_n)
+        item = self._rng.choice(CONCRETE_ITEMS)
 
         audio_sequence = [
             "question_how_many",
-            f"items_{item['name']}",
+            f"items_{item.name}",
         ]
         
         # FIX: _generate_distractors now returns [target, d1, d2] shuffled
@@ -26,10 +24,10 @@ class CountingStrategy(ProblemStrategy):
 
         return ProblemData(
             correct_answer=target,
-            prompt_text=f"How many {item['name']}?",
+            prompt_text=f"How many {item.name}?",
             group_a_count=target,
             group_b_count=0,
-            item_name=item["name"],
+            item_name=item.name,
             operator_type="none",
             audio_sequence=audio_sequence,
             options=options,
@@ -14,6 +14,7 @@ Gemini Audit Fixes:
 """
 
 import random
+from itertools import islice
 from typing import List, Optional
 
 
@@ -25,14 +26,15 @@ class AdditionDistractorGenerator:
     but avoid common constraint violations (negatives, special cases).
     """
     
-    def __init__(self, seed: Optional[int] = None):
+    def __init__(self, seed: Optional[int] = None, rng: Optional[random.Random] = None):
         """
         Initialize the generator.
         
         Args:
             seed: Optional random seed for reproducibility
+            rng: Optional Random to draw from instead (e.g. a seeded strategy's)
         """
-        self._rng = random.Random(seed) if seed is not None else random.Random()
+        self._rng = rng if rng is not None else random.Random(seed)
     
     def generate_distractors(self, target: int) -> List[int]:
         """
@@ -96,13 +98,14 @@ class AdditionDistractorGenerator:
                     if len(distractors) >= 2:
                         break
         
-        # Last resort: random generation
-        attempts = 0
-        while len(distractors) < 2 and attempts < 50:
-            candidate = self._rng.randint(min_val, max(target + 10, 20))
-            if self._is_valid_distractor(candidate, target, distractors, min_val, avoid):
-                distractors.append(candidate)
-            attempts += 1
+        # Last resort: sample from every remaining valid value (terminates
+        # deterministically, unlike a randint rejection loop)
+        if len(distractors) < 2:
+            pool = [
+                c for c in range(min_val, max(target + 10, 20) + 1)
+                if self._is_valid_distractor(c, target, distractors, min_val, avoid)
+            ]
+            distractors += self._rng.sample(pool, min(2 - len(distractors), len(pool)))
         
         return distractors[:2]
     
@@ -144,8 +147,8 @@ class SubtractionDistractorGenerator:
     - Includes operational confusion (a+b instead of a-b)
     """
     
-    def __init__(self, seed: Optional[int] = None):
-        self._rng = random.Random(seed) if seed is not None else random.Random()
+    def __init__(self, seed: Optional[int] = None, rng: Optional[random.Random] = None):
+        self._rng = rng if rng is not None else random.Random(seed)
     
     def generate_distractors(
         self, 
@@ -221,25 +224,32 @@ class SubtractionDistractorGenerator:
                 distractors.add(candidate)
             attempts += 1
         
-        # Convert to list, limit to 2, combine with target, shuffle
-        distractor_list = list(distractors)[:2]
+        # Take the first 2 (no full copy then slice), combine with target, shuffle
+        distractor_list = list(islice(distractors, 2))
         result = [target] + distractor_list
         self._rng.shuffle(result)
         
         return result
 
 
-def generate_addition_distractors(target: int) -> List[int]:
+# Shared by the convenience functions: a new random.Random() per call would
+# re-seed from os.urandom and rebuild the Mersenne Twister state every problem
+_ADDITION_GENERATOR = AdditionDistractorGenerator()
+_SUBTRACTION_GENERATOR = SubtractionDistractorGenerator()
+
+
+def generate_addition_distractors(target: int, rng: Optional[random.Random] = None) -> List[int]:
     """
     Convenience function to generate addition distractors.
     
     Args:
         target: The correct answer
+        rng: Optional Random to draw from (defaults to the shared generator's)
         
     Returns:
         List of 3 unique integers including the target
     """
-    generator = AdditionDistractorGenerator()
+    generator = _ADDITION_GENERATOR if rng is None else AdditionDistractorGenerator(rng=rng)
     return generator.generate_distractors(target)
 
 
@@ -247,7 +257,8 @@ def generate_subtraction_distractors(
     target: int, 
     group_a: int, 
     group_b: int,
-    history_errors: Optional[List[int]] = None
+    history_errors: Optional[List[int]] = None,
+    rng: Optional[random.Random] = None
 ) -> List[int]:
     """
     Convenience function to generate subtraction distractors.
@@ -257,10 +268,11 @@ def generate_subtraction_distractors(
         group_a: The minuend
         group_b: The subtrahend
         history_errors: Optional past wrong answers
+        rng: Optional Random to draw from (defaults to the shared generator's)
         
     Returns:
         List of 3 unique integers including the target
     """
-    generator = SubtractionDistractorGenerator()
+    generator = _SUBTRACTION_GENERATOR if rng is None else SubtractionDistractorGenerator(rng=rng)
     return generator.generate_distractors(target, group_a, group_b, history_errors)
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import random
-
-from .base import ProblemData, ProblemStrategy
+from .base import FALLBACK_ITEMS, NUMBER_TOKENS, ProblemData, ProblemStrategy
 from .distractor_generator import generate_subtraction_distractors
 
 
@@ -10,7 +8,7 @@ class SubtractionStrategy(ProblemStrategy):
     """Generate simple subtraction problems with natural voice variations."""
 
     # Simplified W3 Lead-in tokens (each is a complete phrase clip)
-    W3_LEADINS = [
+    W3_LEADINS = (
         "w3_takeaway_v01",  # "If we take away..."
         "w3_takeaway_v02",  # "Let's take away..."
         "w3_takeaway_v03",  # "Now take away..."
@@ -21,14 +19,14 @@ class SubtractionStrategy(ProblemStrategy):
         "w3_takeaway_v08",  # "Let's try taking away..."
         "w3_takeaway_v09",  # "Can you take away...?"
         "w3_takeaway_v10",  # "Okay, take away..."
-    ]
+    )
 
     # Zero-result tokens (complete phrases)
-    W3_ZERO_RESULTS = [
+    W3_ZERO_RESULTS = (
         "w3_zero_v01",  # "We took them all away. None are left."
         "w3_zero_v02",  # "All gone. That means zero left."
         "w3_zero_v03",  # "None left to count. That's zero."
-    ]
+    )
 
     def generate(self, difficulty: int) -> ProblemData:
         # Check Curriculum first
@@ -47,23 +45,24 @@ class SubtractionStrategy(ProblemStrategy):
                     spec["target"], 
                     spec['a'], 
                     spec['b'],
-                    history_errors=self.profile.get_frequent_errors("subtraction") if self.profile else None
+                    history_errors=self.profile.get_frequent_errors("subtraction") if self.profile else None,
+                    rng=self._rng,
                 ),
             )
 
         # Fallback: Procedural
         max_start = 5 if difficulty < 25 else 10
-        minuend = random.randint(2, max_start)
-        subtrahend = random.randint(1, minuend) 
+        minuend = self._rng.randint(2, max_start)
+        subtrahend = self._rng.randint(1, minuend) 
         result = minuend - subtrahend
 
-        item = random.choice(["apples", "cats", "stars"])
+        item = self._rng.choice(FALLBACK_ITEMS)
 
-        leadin = random.choice(self.W3_LEADINS)
+        leadin = self._rng.choice(self.W3_LEADINS)
         audio = [
-            f"numbers_{minuend:02d}",
+            NUMBER_TOKENS[minuend],
             leadin,
-            f"numbers_{subtrahend:02d}",
+            NUMBER_TOKENS[subtrahend],
             "op_equals",
             "q_left",
         ]
@@ -85,10 +84,11 @@ class SubtractionStrategy(ProblemStrategy):
                 result, 
                 minuend, 
                 subtrahend,
-                history_errors=self.profile.get_frequent_errors("subtraction") if self.profile else None
+                history_errors=self.profile.get_frequent_errors("subtraction") if self.profile else None,
+                rng=self._rng,
             ),
         )
     
     def get_zero_result_feedback(self) -> str:
         """Return audio token for zero-result celebration (called after correct answer)."""
-        return random.choice(self.W3_ZERO_RESULTS)
+        return self._rng.choice(self.W3_ZERO_RESULTS)
@@ -4,7 +4,7 @@ Defines the strict contracts for the application services.
 This allows for Dependency Injection and easy swapping of real/mock implementations.
 """
 
-from typing import Protocol, List, Dict, Any, Optional
+from typing import Protocol, List, Dict, Any, Optional, Callable
 from enum import Enum, auto
 from PySide6.QtCore import QObject
 
@@ -29,22 +29,37 @@ class TutorState(Enum):
 
 class IAudioService(Protocol):
     """
-    Manages audio playback, caching, and channel priority (ducking).
-    Adapts to application needs (TTS vs File).
+    Manages SFX, background music and channel priority (ducking).
+    
+    Single contract for core.audio_service.AudioService. Voice clips are
+    played by VoiceBank, which registers a stop hook here so interruptions
+    go through one place.
     """
-    async def speak(self, text: str, block: bool = True) -> None:
-        """Generates and plays TTS on the VOICE channel."""
-        ...
-        
     def play_sfx(self, sfx_name: str) -> None:
         """Plays a sound effect on the SFX channel."""
         ...
 
+    def play_music(self, music_path: str, loop: bool = True) -> None:
+        """Starts background music on the MUSIC channel."""
+        ...
+
+    def duck_music(self, active: bool) -> None:
+        """Lowers music volume while the VOICE channel is active."""
+        ...
+
+    def set_voice_stop_callback(self, callback: Callable[[], None]) -> None:
+        """Registers the voice provider's stop hook."""
+        ...
+
     def stop_voice(self) -> None:
-        """Immediately stops TTS playback (for interruptions)."""
+        """Immediately stops voice playback (for interruptions)."""
+        ...
+
+    def stop_music(self) -> None:
+        """Stops background music."""
         ...
         
-    async def cleanup(self) -> None:
+    def cleanup(self) -> None:
         """Lifecycle cleanup."""
         ...
 
@@ -85,8 +100,8 @@ class IDatabaseService(Protocol):
         """Add eggs and return new balance."""
         ...
         
-    async def unlock_level(self, level_id: int) -> None:
-        """Unlock a level."""
+    async def unlock_level(self, level_id: int) -> bool:
+        """Unlock a level; returns False if the write failed."""
         ...
         
     async def close(self) -> None:
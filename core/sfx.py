@@ -27,6 +27,10 @@ class SFX:
         LEVEL_COMPLETE: "win.wav"
     }
 
+
+# All known effect names (small fixed set, so eager preload is cheap)
+SFX_NAMES = tuple(SFX.FILENAMES)
+
 def get_sfx_path(sfx_name: str) -> str:
     """Resolve absolute path for a sound effect."""
     filename = SFX.FILENAMES.get(sfx_name)
@@ -15,7 +15,7 @@ import hashlib
 import asyncio
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Awaitable, Iterable, List, Tuple, Optional
 
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtCore import QUrl
@@ -37,6 +37,15 @@ def phrase_to_filename(category: str, index: int, text: str) -> str:
     return f"{clean_cat}_{index:02d}_{text_hash}.wav"
 
 
+def _warm_files(paths: List[Path]) -> None:
+    """Read files once so the player's open hits the OS page cache."""
+    for path in paths:
+        try:
+            path.read_bytes()
+        except OSError:
+            pass
+
+
 class VoiceBank:
     """
     Manages pre-recorded TTS phrases.
@@ -49,6 +58,7 @@ class VoiceBank:
     
     def __init__(self):
         self._phrases: dict[str, list[Tuple[str, Path, float]]] = {}
+        self._prefetched: dict[str, Path] = {}  # category -> clip already picked and warmed
         self._player = QMediaPlayer()
         self._output = QAudioOutput()
         self._player.setAudioOutput(self._output)
@@ -139,14 +149,48 @@ class VoiceBank:
         """Check if category has any available audio."""
         return category in self._phrases and len(self._phrases[category]) > 0
     
+    def prefetch(self, categories: Iterable[str]) -> Awaitable[None]:
+        """
+        Pick the clips that upcoming play_random_async() calls will use and
+        read them in a worker thread, so each one loads from RAM when its
+        turn comes instead of from a cold disk. Await (or track) the result.
+        """
+        paths = []
+        for category in categories:
+            if self.has_category(category):
+                _, audio_path, _ = random.choice(self._phrases[category])
+                self._prefetched[category] = audio_path
+                paths.append(audio_path)
+        return asyncio.to_thread(_warm_files, paths)
+
     async def play_random_async(self, category: str) -> bool:
         """Play a random phrase and await actual completion."""
         if not self.has_category(category):
             return False
             
-        _, audio_path, _ = random.choice(self._phrases[category])
+        audio_path = self._prefetched.pop(category, None)
+        if audio_path is None:
+            _, audio_path, _ = random.choice(self._phrases[category])
         return await self._play_async_internal(audio_path)
     
+    async def play_sequence_async(self, categories: List[str], gap: float = 0.0) -> None:
+        """
+        Play a random phrase from each category in order, awaiting each one.
+        Clips after the first are prefetched while the first plays.
+        """
+        if len(categories) > 1:
+            warm = asyncio.ensure_future(self.prefetch(categories[1:]))
+        else:
+            warm = None
+        try:
+            for i, category in enumerate(categories):
+                if i and gap:
+                    await asyncio.sleep(gap)
+                await self.play_random_async(category)
+        finally:
+            if warm is not None and not warm.done():
+                warm.cancel()
+
     async def play_specific_async(self, category: str, index: int = 0) -> bool:
         """Play a specific phrase and await actual completion."""
         if not self.has_category(category):
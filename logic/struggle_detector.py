@@ -11,8 +11,10 @@ Heuristic Rules:
 
 import time
 import math
-from typing import List
+from operator import sub
+from typing import List, Optional, Tuple
 from PySide6.QtCore import QPointF, QRectF
+from PySide6.QtGui import QPolygonF
 
 class StruggleState:
     NORMAL = "normal"
@@ -25,16 +27,18 @@ class StruggleDetector:
         # Configuration Thresholds (Tuned for ages 4-6)
         self.STROKE_COUNT_TRIGGER = 8       # Minimum strokes to analyze
         self.DENSITY_THRESHOLD = 0.6        # High density = Struggle
+        self.DENSITY_SCORE_TRIGGER = 5.0    # Ink length per unit of bbox diagonal
         self.AREA_COVERAGE_THRESHOLD = 0.3  # % of canvas covered. >0.3 = Play
         self.IDLE_TIMEOUT = 12.0            # Seconds before IDLE trigger
         
         # State
-        self._last_interaction_time = time.time()
+        self._last_interaction_time = time.monotonic()
         self._eraser_use_count = 0
+        self._reset_ink_cache()
 
     def register_interaction(self, is_eraser: bool = False):
         """Call this on every pen down/move event."""
-        self._last_interaction_time = time.time()
+        self._last_interaction_time = time.monotonic()
         if is_eraser:
             self._eraser_use_count += 1
 
@@ -45,7 +49,7 @@ class StruggleDetector:
             strokes: List of strokes, where each stroke is a list of QPointF.
             canvas_rect: The total available drawing area.
         """
-        now = time.time()
+        now = time.monotonic()
         time_since_input = now - self._last_interaction_time
         stroke_count = len(strokes)
 
@@ -63,68 +67,127 @@ class StruggleDetector:
                 return StruggleState.STRUGGLING
             return StruggleState.NORMAL
 
-        # 3. Calculate Bounding Box of all ink
-        ink_rect = self._calculate_ink_bounds(strokes)
+        # 3. Calculate Bounding Box, total length and densest single stroke
+        ink_rect, total_length, peak_density = self._ink_stats(strokes)
         if ink_rect.isEmpty():
             return StruggleState.NORMAL
 
-        # 4. Calculate Heuristics
-        # Ratio of ink bounding box to total canvas
-        coverage_ratio = (ink_rect.width() * ink_rect.height()) / (canvas_rect.width() * canvas_rect.height())
-        
+        # 4. Calculate Heuristics (compared in multiplied/squared form:
+        # no division, no sqrt)
+        ink_w, ink_h = ink_rect.width(), ink_rect.height()
+
+        # Coverage: ratio of ink bounding box to total canvas
+        ink_area = ink_w * ink_h
+        canvas_area = canvas_rect.width() * canvas_rect.height()
+
         # Density: How much ink is packed into that bounding box?
         # A simple approximation: Total stroke length / Diagonal of bounding box
-        total_length = sum(self._stroke_length(s) for s in strokes)
-        diag = math.sqrt(ink_rect.width()**2 + ink_rect.height()**2)
-        density_score = total_length / diag if diag > 0 else 0
+        # (the box is non-empty here, so the diagonal is positive)
+        diag_sq = ink_w * ink_w + ink_h * ink_h
 
         # 5. Determine State
         
         # Scenario A: Play/Drawing
         # Large coverage, high stroke count. Child is likely drawing a picture.
-        if coverage_ratio > self.AREA_COVERAGE_THRESHOLD:
+        if ink_area > self.AREA_COVERAGE_THRESHOLD * canvas_area:
             return StruggleState.PLAYING
 
         # Scenario B: Struggle
         # Small area, high density (scribbling over same spot) OR high eraser use
-        if density_score > 5.0 or self._eraser_use_count > 4:
+        # density > trigger  <=>  length^2 > trigger^2 * diag^2
+        # The densest single stroke is checked too, so one stray line across
+        # the canvas cannot dilute a tight scribble in a corner.
+        trigger = self.DENSITY_SCORE_TRIGGER
+        if (total_length * total_length > trigger * trigger * diag_sq
+                or peak_density > trigger
+                or self._eraser_use_count > 4):
             return StruggleState.STRUGGLING
 
         return StruggleState.NORMAL
 
-    def _calculate_ink_bounds(self, strokes: List[List[QPointF]]) -> QRectF:
-        """Returns the bounding rectangle of all strokes."""
+    def _ink_stats(self, strokes: List[List[QPointF]]) -> Tuple[QRectF, float, float]:
+        """
+        Returns the bounding rectangle and total length of all strokes, plus
+        the highest density (length / own bbox diagonal) of any one stroke.
+
+        Every stroke but the last is treated as finished and folded into
+        running totals once, so each call only re-measures the last
+        (possibly in-progress) stroke instead of rescanning the session.
+        """
+        finished = len(strokes) - 1
+        done = self._ink_done
+        if (strokes is not self._ink_strokes or finished < done
+                or (done and strokes[done - 1] is not self._ink_last_folded)):
+            # New stroke list, or strokes were removed (undo/clear), possibly
+            # with new ones drawn since: the last folded stroke is no longer
+            # where we left it, so rebuild
+            self._reset_ink_cache()
+            self._ink_strokes = strokes
+
+        for stroke in strokes[self._ink_done:finished]:
+            length, rect = self._stroke_length(stroke), self._stroke_bounds(stroke)
+            self._ink_length += length
+            self._ink_bounds = self._union_bounds(self._ink_bounds, rect)
+            self._ink_peak = max(self._ink_peak, self._local_density(length, rect))
+        if finished > self._ink_done:
+            self._ink_done = finished
+            self._ink_last_folded = strokes[finished - 1]
+
         if not strokes:
-            return QRectF()
-            
-        min_x, min_y = float('inf'), float('inf')
-        max_x, max_y = float('-inf'), float('-inf')
-        
-        has_points = False
-        for stroke in strokes:
-            for point in stroke:
-                has_points = True
-                min_x = min(min_x, point.x())
-                min_y = min(min_y, point.y())
-                max_x = max(max_x, point.x())
-                max_y = max(max_y, point.y())
-                
-        if not has_points:
-            return QRectF()
-            
-        return QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+            return QRectF(), 0.0, 0.0
+        last = strokes[-1]
+        length, rect = self._stroke_length(last), self._stroke_bounds(last)
+        bounds = self._union_bounds(self._ink_bounds, rect)
+        return (
+            bounds if bounds is not None else QRectF(),
+            self._ink_length + length,
+            max(self._ink_peak, self._local_density(length, rect)),
+        )
+
+    @staticmethod
+    def _stroke_bounds(stroke: List[QPointF]) -> Optional[QRectF]:
+        """Bounding box of one stroke (QPolygonF reduces the points in C++)."""
+        return QPolygonF(stroke).boundingRect() if stroke else None
+
+    @staticmethod
+    def _local_density(length: float, rect: Optional[QRectF]) -> float:
+        """Stroke length per unit of its own bbox diagonal (0 for a dot)."""
+        if rect is None:
+            return 0.0
+        diag = math.hypot(rect.width(), rect.height())
+        return length / diag if diag > 0 else 0.0
+
+    @staticmethod
+    def _union_bounds(bounds: Optional[QRectF], rect: Optional[QRectF]) -> Optional[QRectF]:
+        """Grow bounds to cover a stroke's bounding box."""
+        if rect is None:
+            return bounds
+        if bounds is None:
+            return rect
+        # Combine edges by hand: QRectF.united drops zero-size (single point) rects
+        left = min(bounds.left(), rect.left())
+        top = min(bounds.top(), rect.top())
+        right = max(bounds.right(), rect.right())
+        bottom = max(bounds.bottom(), rect.bottom())
+        return QRectF(left, top, right - left, bottom - top)
 
     def _stroke_length(self, stroke: List[QPointF]) -> float:
         """Calculates total pixel length of a stroke."""
-        length = 0.0
-        for i in range(1, len(stroke)):
-            p1 = stroke[i-1]
-            p2 = stroke[i]
-            dist = math.sqrt((p2.x() - p1.x())**2 + (p2.y() - p1.y())**2)
-            length += dist
-        return length
+        # map() over coordinate lists keeps the per-segment work in C
+        xs = [p.x() for p in stroke]
+        ys = [p.y() for p in stroke]
+        return sum(map(math.hypot, map(sub, xs[1:], xs), map(sub, ys[1:], ys)), 0.0)
+
+    def _reset_ink_cache(self):
+        self._ink_strokes: Optional[List[List[QPointF]]] = None  # List the totals describe
+        self._ink_done = 0                                        # Strokes folded in
+        self._ink_last_folded: Optional[List[QPointF]] = None     # strokes[_ink_done - 1]
+        self._ink_length = 0.0
+        self._ink_bounds: Optional[QRectF] = None
+        self._ink_peak = 0.0                                      # Densest finished stroke
 
     def reset(self):
         """Call when clearing the canvas or starting new problem."""
-        self._last_interaction_time = time.time()
+        self._last_interaction_time = time.monotonic()
         self._eraser_use_count = 0
+        self._reset_ink_cache()
@@ -6,7 +6,9 @@ The original generator saved this as .mp3 without encoding.
 This script adds proper WAV headers.
 """
 import os
+import shutil
 import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 VOICE_BANK_DIR = Path("assets/audio/voice_bank")
@@ -16,15 +18,19 @@ OUTPUT_DIR = Path("assets/audio/voice_bank_wav")
 SAMPLE_RATE = 24000
 BITS_PER_SAMPLE = 16
 NUM_CHANNELS = 1
+BYTE_RATE = SAMPLE_RATE * NUM_CHANNELS * (BITS_PER_SAMPLE // 8)
+BLOCK_ALIGN = NUM_CHANNELS * (BITS_PER_SAMPLE // 8)
+
+# 44-byte canonical PCM header, format compiled once
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+# Read/copy buffer size
+COPY_CHUNK = 1 << 20
 
 
 def create_wav_header(data_size: int) -> bytes:
     """Create a WAV file header for raw PCM data."""
-    byte_rate = SAMPLE_RATE * NUM_CHANNELS * (BITS_PER_SAMPLE // 8)
-    block_align = NUM_CHANNELS * (BITS_PER_SAMPLE // 8)
-    
-    header = struct.pack(
-        '<4sI4s4sIHHIIHH4sI',
+    return _WAV_HEADER.pack(
         b'RIFF',                    # ChunkID
         data_size + 36,             # ChunkSize (file size - 8)
         b'WAVE',                    # Format
@@ -33,43 +39,49 @@ def create_wav_header(data_size: int) -> bytes:
         1,                          # AudioFormat (PCM = 1)
         NUM_CHANNELS,               # NumChannels
         SAMPLE_RATE,                # SampleRate
-        byte_rate,                  # ByteRate
-        block_align,                # BlockAlign
+        BYTE_RATE,                  # ByteRate
+        BLOCK_ALIGN,                # BlockAlign
         BITS_PER_SAMPLE,            # BitsPerSample
         b'data',                    # Subchunk2ID
         data_size                   # Subchunk2Size
     )
-    return header
+
+
+def _count_leading_zeros(f) -> int:
+    """Count the zero padding at the start of a file, reading only as far as needed."""
+    skipped = 0
+    while chunk := f.read(COPY_CHUNK):
+        stripped = chunk.lstrip(b'\x00')  # C-level scan
+        skipped += len(chunk) - len(stripped)
+        if stripped:
+            break
+    return skipped
 
 
 def convert_pcm_to_wav(input_path: Path, output_path: Path) -> bool:
     """Convert a raw PCM file to WAV format."""
     try:
-        # Read raw PCM data
-        with open(input_path, 'rb') as f:
-            pcm_data = f.read()
-        
-        # Skip leading zeros (padding)
-        start = 0
-        while start < len(pcm_data) and pcm_data[start] == 0:
-            start += 1
-        
-        # If file is all zeros, skip it
-        if start >= len(pcm_data) - 100:
-            print(f"  SKIP (empty): {input_path.name}")
-            return False
-        
-        # Find actual PCM start (align to 2 bytes for 16-bit)
-        start = start & ~1
-        pcm_data = pcm_data[start:]
-        
-        # Create WAV with header
-        wav_header = create_wav_header(len(pcm_data))
-        
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(wav_header)
-            f.write(pcm_data)
+        with open(input_path, 'rb') as src:
+            total = os.fstat(src.fileno()).st_size
+            
+            # Skip leading zeros (padding)
+            start = _count_leading_zeros(src)
+            
+            # If file is all zeros, skip it
+            if start >= total - 100:
+                print(f"  SKIP (empty): {input_path.name}")
+                return False
+            
+            # Find actual PCM start (align to 2 bytes for 16-bit)
+            start = start & ~1
+            
+            # Write the header, then stream the payload in chunks: the
+            # file is never held in memory whole
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'wb') as dst:
+                dst.write(create_wav_header(total - start))
+                src.seek(start)
+                shutil.copyfileobj(src, dst, COPY_CHUNK)
         
         return True
         
@@ -83,22 +95,29 @@ def main():
         print(f"Source directory not found: {VOICE_BANK_DIR}")
         return
     
-    mp3_files = list(VOICE_BANK_DIR.glob("*.mp3"))
-    print(f"Found {len(mp3_files)} .mp3 files to convert")
+    # Filter on the raw entry name; Paths are only built for matches
+    with os.scandir(VOICE_BANK_DIR) as it:
+        mp3_entries = [e for e in it if e.name.endswith(".mp3") and e.is_file()]
+    print(f"Found {len(mp3_entries)} .mp3 files to convert")
     
     success = 0
     failed = 0
     
-    for mp3_path in mp3_files:
-        # Change extension to .wav
-        wav_name = mp3_path.stem + ".wav"
-        wav_path = OUTPUT_DIR / wav_name
-        
-        if convert_pcm_to_wav(mp3_path, wav_path):
-            success += 1
-            print(f"  OK: {wav_name}")
-        else:
-            failed += 1
+    # Files are independent and the work is I/O plus C-level scans that
+    # release the GIL, so a thread pool converts them in parallel
+    with ThreadPoolExecutor() as pool:
+        futures = {}
+        for entry in mp3_entries:
+            # Change extension to .wav
+            wav_name = entry.name[:-len(".mp3")] + ".wav"
+            future = pool.submit(convert_pcm_to_wav, Path(entry.path), OUTPUT_DIR / wav_name)
+            futures[future] = wav_name
+        for future in as_completed(futures):
+            if future.result():
+                success += 1
+                print(f"  OK: {futures[future]}")
+            else:
+                failed += 1
     
     print(f"\nConversion complete: {success} success, {failed} failed")
     print(f"Output directory: {OUTPUT_DIR}")
@@ -1,5 +1,6 @@
 import hashlib
 import os
+import shutil
 from pathlib import Path
 import yaml
 
@@ -13,6 +14,14 @@ def phrase_to_filename(category: str, index: int, text: str) -> str:
     clean_cat = category.replace("_", "-")
     return f"{clean_cat}_{index:02d}_{text_hash}.wav"
 
+def link_or_copy(source: Path, dest: Path):
+    """Hardlink dest to source (NTFS and POSIX both support it); copy if linking fails."""
+    try:
+        os.link(source, dest)
+    except OSError:
+        # Different volume, FAT32, or no permission: fall back to a real copy
+        shutil.copy2(source, dest)
+
 def sync():
     with open(YAML_PATH, 'r') as f:
         bank = yaml.safe_load(f)
@@ -24,6 +33,9 @@ def sync():
     mock_files = sorted(list(AUDIO_DIR.glob("q_*_mock.wav")))
     mock_idx = 0
     
+    # One directory listing up front instead of a stat per phrase
+    existing = set(os.listdir(AUDIO_DIR))
+    
     for cat in categories:
         if cat not in bank:
             continue
@@ -33,20 +45,17 @@ def sync():
             expected = phrase_to_filename(cat, i, text)
             full_path = AUDIO_DIR / expected
             
-            if not full_path.exists():
+            if expected not in existing:
                 if mock_idx < len(mock_files):
                     source = mock_files[mock_idx]
                     print(f"Linking {expected} to {source.name}")
-                    # On Windows, we'll just copy for simplicity unless we want symlinks
-                    import shutil
-                    shutil.copy2(source, full_path)
+                    link_or_copy(source, full_path)
                     mock_idx += 1
                 else:
                     # Reuse last mock if we run out
                     source = mock_files[-1]
                     print(f"Reuse linking {expected} to {source.name}")
-                    import shutil
-                    shutil.copy2(source, full_path)
+                    link_or_copy(source, full_path)
 
 if __name__ == "__main__":
     sync()
@@ -0,0 +1,106 @@
+# tests/test_audio_cache.py
+"""Tests for the TTS Audio Cache."""
+import pytest
+from core.audio_cache import AudioCacheManager
+
+
+@pytest.fixture
+def cache(tmp_path) -> AudioCacheManager:
+    return AudioCacheManager(tmp_path / "tts")
+
+
+def test_get_path_is_stable(cache: AudioCacheManager):
+    """Same text and voice should map to the same file."""
+    assert cache.get_path("Well done!", "voice") == cache.get_path("Well done!", "voice")
+
+
+def test_get_path_differs_by_voice(cache: AudioCacheManager):
+    """Different voices should not share cache entries."""
+    assert cache.get_path("Well done!", "a") != cache.get_path("Well done!", "b")
+
+
+def test_get_path_separates_text_and_voice(cache: AudioCacheManager):
+    """Moving characters between text and voice should not collide."""
+    assert cache.get_path("ab", "c") != cache.get_path("a", "bc")
+
+
+def test_has_reflects_disk(cache: AudioCacheManager):
+    """has() should see files already on disk when first looked up."""
+    assert not cache.has("Hello", "voice")
+    cache.get_path("Hello", "voice").write_bytes(b"mp3")
+
+    fresh = AudioCacheManager(cache.cache_dir)
+    assert fresh.has("Hello", "voice")
+
+
+def test_mark_existing_updates_has(cache: AudioCacheManager):
+    """mark_existing() should flip the cached flag after a write."""
+    assert not cache.has("Great effort!", "voice")
+    cache.get_path("Great effort!", "voice").write_bytes(b"mp3")
+    cache.mark_existing("Great effort!", "voice")
+    assert cache.has("Great effort!", "voice")
+
+
+def test_enforce_limits_evicts_oldest_first(tmp_path):
+    """Eviction should drop the oldest entries and keep the running total exact."""
+    cache = AudioCacheManager(tmp_path / "tts", max_files=2)
+    for text in ("one", "two", "three"):
+        cache.get_path(text, "voice").write_bytes(b"x" * 10)
+        cache.mark_existing(text, "voice")
+
+    assert cache.enforce_limits() == 1
+    assert len(cache) == 2
+    assert cache.total_size == 20
+    assert not cache.get_path("one", "voice").exists()
+    assert not cache.has("one", "voice")
+    assert cache.has("three", "voice")
+
+
+def test_touch_protects_recently_used(tmp_path):
+    """A cache hit should move the phrase to the back of the eviction order."""
+    cache = AudioCacheManager(tmp_path / "tts", max_files=2)
+    for text in ("one", "two"):
+        cache.get_path(text, "voice").write_bytes(b"x" * 10)
+        cache.mark_existing(text, "voice")
+    cache.touch("one", "voice")
+    cache.get_path("three", "voice").write_bytes(b"x" * 10)
+    cache.mark_existing("three", "voice")
+
+    assert cache.enforce_limits() == 1
+    assert cache.has("one", "voice")
+    assert not cache.has("two", "voice")
+
+
+def test_byte_cap_is_enforced(tmp_path):
+    """Exceeding the byte cap should evict even under the file cap."""
+    cache = AudioCacheManager(tmp_path / "tts", max_bytes=15)
+    for text in ("one", "two"):
+        cache.get_path(text, "voice").write_bytes(b"x" * 10)
+        cache.mark_existing(text, "voice")
+
+    cache.enforce_limits()
+    assert cache.total_size <= 15
+
+
+def test_index_is_reused_across_instances(tmp_path):
+    """A fresh manager should load sizes from the sidecar index."""
+    cache = AudioCacheManager(tmp_path / "tts")
+    cache.get_path("Hi", "voice").write_bytes(b"x" * 7)
+    cache.mark_existing("Hi", "voice")
+
+    fresh = AudioCacheManager(tmp_path / "tts")
+    assert fresh.has("Hi", "voice")
+    assert fresh.total_size == 7
+
+
+def test_stale_index_triggers_rescan(tmp_path):
+    """Files removed behind the index's back should force a rescan."""
+    cache = AudioCacheManager(tmp_path / "tts")
+    for text in ("a", "b"):
+        cache.get_path(text, "voice").write_bytes(b"x" * 5)
+        cache.mark_existing(text, "voice")
+    cache.get_path("a", "voice").unlink()
+
+    fresh = AudioCacheManager(tmp_path / "tts")
+    assert len(fresh) == 1
+    assert fresh.total_size == 5
@@ -1,11 +1,15 @@
 # tests/test_director.py
 """Tests for the Director State Machine."""
 import pytest
-from unittest.mock import MagicMock
 from core.director import Director, AppState
 from core.container import ServiceContainer
 
 
+class _Recorder(list):
+    """Signal slot that records every emitted value."""
+    __call__ = list.append
+
+
 @pytest.fixture
 def container():
     """Create a minimal service container."""
@@ -66,23 +70,23 @@ def test_same_state_transition_is_noop(director: Director):
 
 def test_state_changed_signal_emitted(director: Director):
     """State changes should emit signal."""
-    callback = MagicMock()
-    director.state_changed.connect(callback)
+    received = _Recorder()
+    director.state_changed.connect(received)
     
     director.set_state(AppState.INPUT_ACTIVE)
     
-    callback.assert_called_once_with(AppState.INPUT_ACTIVE)
+    assert received == [AppState.INPUT_ACTIVE]
 
 
 def test_state_changed_not_emitted_on_invalid(director: Director):
     """Invalid transitions should not emit signal."""
-    callback = MagicMock()
-    director.state_changed.connect(callback)
+    received = _Recorder()
+    director.state_changed.connect(received)
     
     # Try invalid transition
     director.set_state(AppState.CELEBRATION)
     
-    callback.assert_not_called()
+    assert received == []
 
 
 def test_force_skip_from_tutor_speaking(director: Director):
@@ -0,0 +1,84 @@
+# tests/test_struggle_detector.py
+"""Tests for the Struggle Detector heuristics."""
+import math
+import pytest
+from PySide6.QtCore import QPointF, QRectF
+from logic.struggle_detector import StruggleDetector, StruggleState
+
+
+@pytest.fixture
+def detector() -> StruggleDetector:
+    return StruggleDetector()
+
+
+def full_stats(strokes):
+    """Reference: rescan every point."""
+    points = [p for stroke in strokes for p in stroke]
+    xs = [p.x() for p in points]
+    ys = [p.y() for p in points]
+    length = sum(
+        math.hypot(b.x() - a.x(), b.y() - a.y())
+        for stroke in strokes
+        for a, b in zip(stroke, stroke[1:])
+    )
+    return (min(xs), min(ys), max(xs), max(ys)), length
+
+
+def assert_matches(detector: StruggleDetector, strokes):
+    rect, length, _ = detector._ink_stats(strokes)
+    (left, top, right, bottom), expected = full_stats(strokes)
+    assert (rect.left(), rect.top(), rect.right(), rect.bottom()) == (left, top, right, bottom)
+    assert length == pytest.approx(expected)
+
+
+def test_incremental_stats_track_growing_strokes(detector: StruggleDetector):
+    """Extending the last stroke and adding new ones should match a full rescan."""
+    strokes = [[QPointF(0, 0), QPointF(3, 4)]]
+    assert_matches(detector, strokes)
+
+    strokes[-1].append(QPointF(10, 4))
+    assert_matches(detector, strokes)
+
+    strokes.append([QPointF(-2, 20)])
+    strokes.append([QPointF(5, 5), QPointF(6, 6)])
+    assert_matches(detector, strokes)
+
+
+def test_removed_strokes_rebuild_stats(detector: StruggleDetector):
+    """Undoing strokes should not leave them in the cached totals."""
+    strokes = [[QPointF(0, 0), QPointF(100, 100)], [QPointF(1, 1), QPointF(2, 2)], [QPointF(3, 3)]]
+    detector._ink_stats(strokes)
+
+    del strokes[0]
+    del strokes[0]
+    assert_matches(detector, strokes)
+
+
+def test_undo_then_redraw_rebuilds_stats(detector: StruggleDetector):
+    """Undone strokes replaced by as many new ones should not linger in the totals."""
+    strokes = [[QPointF(0, 0), QPointF(1, 1)], [QPointF(0, 0), QPointF(500, 500)], [QPointF(2, 2)]]
+    detector._ink_stats(strokes)
+
+    del strokes[1:]
+    strokes.append([QPointF(3, 3), QPointF(4, 4)])
+    strokes.append([QPointF(5, 5)])
+    assert_matches(detector, strokes)
+
+
+def test_analyze_classifies_play_and_struggle(detector: StruggleDetector):
+    """Wide drawings read as play; dense scribbles in one spot read as struggle."""
+    canvas = QRectF(0, 0, 100, 100)
+    drawing = [[QPointF(i * 10, 0), QPointF(i * 10, 90)] for i in range(9)]
+    assert detector.analyze(drawing, canvas) == StruggleState.PLAYING
+
+    detector.reset()
+    scribble = [[QPointF(0, 0), QPointF(10, 10), QPointF(0, 10), QPointF(10, 0)] for _ in range(9)]
+    assert detector.analyze(scribble, canvas) == StruggleState.STRUGGLING
+
+
+def test_dense_scribble_is_not_diluted_by_stray_line(detector: StruggleDetector):
+    """A tight scribble should read as struggle even next to a long stray line."""
+    canvas = QRectF(0, 0, 1000, 1000)
+    zigzag = [QPointF(10 * (i % 2), i * 0.5) for i in range(20)]
+    strokes = [list(zigzag) for _ in range(8)] + [[QPointF(0, 0), QPointF(500, 0)]]
+    assert detector.analyze(strokes, canvas) == StruggleState.STRUGGLING
@@ -2,7 +2,7 @@
 Shared UI Components
 """
 from PySide6.QtWidgets import QPushButton, QLabel, QWidget
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property, Qt, Signal
+from PySide6.QtCore import QPropertyAnimation, QEasingCurve, Property, Qt, Signal, QEvent
 from PySide6.QtGui import QFont
 
 class JuicyButton(QPushButton):
@@ -28,15 +28,36 @@ class JuicyLabel(QLabel):
         super().__init__(text, parent)
         self._font_scale = 1.0
         self._base_size = 20
+        # One QFont mutated in place; setFont only when the pixel size moves.
+        # Re-synced from self.font() whenever a caller changes the font.
+        self._font = QFont(self.font())
+        self._last_px = -1
+        self._applying_font = False
         # Initialize animation
         self.anim = QPropertyAnimation(self, b"font_scale")
         self.anim.setDuration(300)
         self.anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+        # Pulse keyframes are fixed, so set them once
+        self.anim.setKeyValueAt(0, 1.0)
+        self.anim.setKeyValueAt(0.5, 1.5)
+        self.anim.setKeyValueAt(1, 1.0)
 
     def set_base_font_size(self, size):
         self._base_size = size
+        self._sync_font()
         self._update_font()
 
+    def _sync_font(self):
+        """Adopt the current font (family, weight, ...) so we scale it, not a stale copy."""
+        self._font = QFont(self.font())
+        self._last_px = -1
+
+    def changeEvent(self, event):
+        # setFont/stylesheet changes from outside; ignore the ones we make
+        if event.type() == QEvent.Type.FontChange and not self._applying_font:
+            self._sync_font()
+        super().changeEvent(event)
+
     @Property(float)
     def font_scale(self):
         return self._font_scale
@@ -47,16 +68,20 @@ class JuicyLabel(QLabel):
         self._update_font()
 
     def _update_font(self):
-        f = self.font()
-        f.setPixelSize(int(self._base_size * self._font_scale))
-        self.setFont(f)
+        px = int(self._base_size * self._font_scale)
+        if px == self._last_px:
+            return
+        self._last_px = px
+        self._font.setPixelSize(px)
+        self._applying_font = True
+        try:
+            self.setFont(self._font)
+        finally:
+            self._applying_font = False
 
     def pop(self):
         """Trigger a pulse animation (1.0 -> 1.5 -> 1.0)."""
         self.anim.stop()
-        self.anim.setKeyValueAt(0, 1.0)
-        self.anim.setKeyValueAt(0.5, 1.5)
-        self.anim.setKeyValueAt(1, 1.0)
         self.anim.start()
 
 
@@ -74,13 +99,16 @@ class SkipOverlay(QWidget):
     def __init__(self, parent, director):
         super().__init__(parent)
         self.director = director
+        # Views assign .audio before building the overlay; resolve it once
+        self._audio = getattr(parent, 'audio', None)
         
         # Transparent but catches events
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setStyleSheet("background-color: rgba(0, 0, 0, 0);")
         
-        # Cover entire parent
+        # Cover entire parent, following its resizes via an event filter
         self.resize(parent.size())
+        parent.installEventFilter(self)
         self.hide()
         
         # Connect to director for skip
@@ -91,15 +119,16 @@ class SkipOverlay(QWidget):
         self.director.force_skip()
         
         # Also stop any playing audio
-        if hasattr(self.parent(), 'audio') and self.parent().audio:
-            self.parent().audio.stop_voice()
+        if self._audio is not None:
+            self._audio.stop_voice()
     
     def mousePressEvent(self, event):
         """Catch all mouse presses and emit skip signal."""
         self.clicked.emit()
         event.accept()
     
-    def resizeEvent(self, event):
-        """Stay same size as parent."""
-        if self.parent():
-            self.resize(self.parent().size())
+    def eventFilter(self, obj, event):
+        """Stay same size as parent (our own resizes never re-enter here)."""
+        if obj is self.parent() and event.type() == QEvent.Type.Resize:
+            self.resize(event.size())
+        return False
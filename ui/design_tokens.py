@@ -3,7 +3,8 @@ Design Tokens - Math Omni (Sidereal Voyager)
 Central source of truth for all UI styling.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # =============================================================================
 # TYPOGRAPHY
@@ -21,7 +22,7 @@ BUTTON_GAP = 40
 # =============================================================================
 # PALETTE (Warm & Soft) - v2.1
 # =============================================================================
-COLORS: Dict[str, str] = {
+COLORS: Mapping[str, str] = MappingProxyType({
     # Canvas
     'canvas': '#FFF9F0',            # Warm Cloud - main background
     'canvas_gradient': '#FFF0E1',   # Peachier bottom gradient
@@ -61,12 +62,12 @@ COLORS: Dict[str, str] = {
     'background_start': '#FFF9F0',
     'background_end': '#FFF0E1',
     'focus': '#48DBFB',
-}
+})
 
 # =============================================================================
 # STYLESHEETS (Juicy 3D Buttons)
 # =============================================================================
-STYLES: Dict[str, str] = {
+STYLES: Mapping[str, str] = MappingProxyType({
     # Primary action button (Submit, Next, Answer options)
     "premium_button": """
         QPushButton {
@@ -249,7 +250,7 @@ STYLES: Dict[str, str] = {
             border: 4px solid #F5E6C8;
         }
     """
-}
+})
 
 # =============================================================================
 # GRADIENTS
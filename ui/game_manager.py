@@ -95,11 +95,11 @@ class GameManager(QMainWindow):
         # Create views (Inject Director)
         self.landing_view = LandingPageView(self.profile)
         self.map_view = MapView(self.db)
-        self.activity_view = ActivityView(self.director, self.audio) 
+        # Activity view is built on the first level start (off the startup path)
+        self.activity_view: Optional[ActivityView] = None
         
         self.stack.addWidget(self.landing_view)
         self.stack.addWidget(self.map_view)
-        self.stack.addWidget(self.activity_view)
         
         # Celebration Overlay
         self.celebration = CelebrationOverlay(self)
@@ -108,8 +108,6 @@ class GameManager(QMainWindow):
         self.landing_view.domain_selected.connect(self._on_domain_selected)
         self.map_view.level_selected.connect(self._start_level)
         self.map_view.practice_mode_selected.connect(self._start_practice)  # New signal
-        self.activity_view.back_to_map.connect(self._show_map)
-        self.activity_view.answer_submitted.connect(self._process_answer)
         
         # Reports
         self.report_gen = ProgressReportGenerator(self.profile)
@@ -119,6 +117,15 @@ class GameManager(QMainWindow):
         self.stack.setCurrentWidget(self.landing_view)
         self.director.set_state(AppState.IDLE)
 
+    def _ensure_activity_view(self) -> ActivityView:
+        """Build, wire and stack the activity view on first use."""
+        if self.activity_view is None:
+            self.activity_view = ActivityView(self.director, self.audio)
+            self.stack.addWidget(self.activity_view)
+            self.activity_view.back_to_map.connect(self._show_map)
+            self.activity_view.answer_submitted.connect(self._process_answer)
+        return self.activity_view
+
     def resizeEvent(self, event):
         """Ensure overlay covers entire window on resize."""
         self.celebration.resize(self.size())
@@ -130,18 +137,19 @@ class GameManager(QMainWindow):
         Z.ai Fix: Better exception logging for failed tasks.
         """
         task = asyncio.create_task(coro)
+        # Strong refs are required: the loop only holds tasks weakly
         self._pending_tasks.add(task)
-        
-        def cleanup(t):
-            self._pending_tasks.discard(t)
-            if not t.cancelled():
-                exc = t.exception()
-                if exc:
-                    logger.error("Background task failed", exc_info=exc)
-        
-        task.add_done_callback(cleanup)
+        task.add_done_callback(self._on_task_done)
         return task
 
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Untrack a finished task and log its failure, if any."""
+        self._pending_tasks.discard(task)
+        if not task.cancelled():
+            exc = task.exception()
+            if exc:
+                logger.error("Background task failed", exc_info=exc)
+
     def _cancel_pending(self) -> None:
         """Cancel all pending tasks and stop any active timers/audio."""
         for task in list(self._pending_tasks):
@@ -272,10 +280,9 @@ class GameManager(QMainWindow):
     
     async def _play_audio_sequence(self, clips: list[str]):
         """Plays a list of clips in order, waiting for each."""
-        for clip in clips:
-            await self.voice_bank.play_random_async(clip)
-            # Small gap for natural speech pacing
-            await asyncio.sleep(0.2)
+        # Small gap between clips for natural speech pacing
+        await self.voice_bank.play_sequence_async(clips, gap=0.2)
+        await asyncio.sleep(0.2)
         
         self.director.set_state(AppState.INPUT_ACTIVE)
 
@@ -321,7 +328,7 @@ class GameManager(QMainWindow):
         self._current_item_name = data.item_name  # For VoiceBank lookup
 
         # Configure activity view
-        self.activity_view.render_problem(
+        self._ensure_activity_view().render_problem(
             level=self.current_level,
             eggs=self.current_eggs,
             problem=data,
@@ -351,23 +358,23 @@ class GameManager(QMainWindow):
             
             # Use voice bank for encouragement
             category = get_wrong_category(self._wrong_attempts)
-            
-            # Provide hint after encouragement (event-driven)
-            async def encouragement_flow():
-                await self.voice_bank.play_random_async(category)
-                if self._wrong_attempts <= 3:
-                    self._process_hint_after_delay()
-                else:
-                    self._resume_after_hint()
-            
-            self._track_task(encouragement_flow())
+            self._track_task(self._encouragement_flow(category))
             return
         
         # Success - run async handler
         self._track_task(self._handle_success())
     
+    async def _encouragement_flow(self, category: str):
+        """Play encouragement, then provide a hint (event-driven)."""
+        await self.voice_bank.play_random_async(category)
+        if self._wrong_attempts <= 3:
+            self._process_hint_after_delay()
+        else:
+            self._resume_after_hint()
+    
     async def _handle_success(self):
         """Async success handler - update economy, progress, audio."""
+        completed_level = None
         if self.is_practice_mode:
             print(f"[GameManager] SUCCESS: Practice complete. Skipping economy updates.")
             self.activity_view.show_reward(0, self.current_eggs)
@@ -383,17 +390,15 @@ class GameManager(QMainWindow):
             self.activity_view.show_reward(REWARD_CORRECT, self.current_eggs)
             
             # 2. Unlock level progress
-            await self.db.unlock_level(self.current_level)
+            # Only let the map skip its DB query if the unlock was saved
+            if await self.db.unlock_level(self.current_level):
+                completed_level = self.current_level
         
         # 3. Audio - Use premium voice bank (event-driven)
         self.director.set_state(AppState.CELEBRATION)
         
-        # Success Feedback
-        category = get_success_category()
-        await self.voice_bank.play_random_async(category)
-        
-        # Celebration audio
-        await self.voice_bank.play_random_async("celebration_rewards")
+        # Success feedback, then celebration audio
+        await self.voice_bank.play_sequence_async([get_success_category(), "celebration_rewards"])
         
         self.director.set_state(AppState.CELEBRATION)
         msg = f"LEVEL {self.current_level} COMPLETE!" if not self.is_practice_mode else "PRACTICE COMPLETE!"
@@ -401,13 +406,14 @@ class GameManager(QMainWindow):
         
         # 4. Wait for celebration (2.5s)
         await asyncio.sleep(2.5)
-        self._show_map()
+        self._show_map(completed_level)
     
-    def _show_map(self):
+    def _show_map(self, completed_level: Optional[int] = None):
         """Return to map view with cancellation check."""
         self._cancel_pending()
         self.celebration.stop()  # Ensure closed if skipped
-        self._track_task(self.map_view.refresh(self.current_eggs))
+        # A just-completed level is passed in-band so the map skips a DB read
+        self._track_task(self.map_view.refresh(self.current_eggs, completed_level))
         self.stack.setCurrentWidget(self.map_view)
         self.director.set_state(AppState.IDLE)
 
@@ -422,12 +428,8 @@ class GameManager(QMainWindow):
 
     async def _announce_level_legacy(self, level: int, item_name: str) -> None:
         """Legacy announcer for simple counting."""
-        # 1. Level Start phrase
-        await self.voice_bank.play_random_async("level_start")
-        
-        # 2. Item-specific question 
-        item_category = f"items_{item_name}"
-        await self.voice_bank.play_random_async(item_category)
+        # Level Start phrase, then the item-specific question
+        await self.voice_bank.play_sequence_async(["level_start", f"items_{item_name}"])
         
         self.director.set_state(AppState.INPUT_ACTIVE)
 
@@ -29,13 +29,16 @@ import sys
 sys.path.append('..')
 from config import (
     COLORS, FONT_SIZES, MIN_TOUCH_TARGET, TIMING,
-    MAX_ATTEMPTS_BEFORE_SCAFFOLDING, MAX_DRAWING_PASSES, ITEMS
+    MAX_ATTEMPTS_BEFORE_SCAFFOLDING, MAX_DRAWING_PASSES, ITEMS,
+    TTS_CACHE_SWEEP_MS
 )
 
 # Confusion threshold: if child draws this many more strokes than expected,
 # escalate to cloud AI for contextual help
 CONFUSION_STROKE_THRESHOLD = 10
 
+FRESH_CANVAS_MESSAGE = "Let's try again on a fresh canvas!"
+
 
 class MainWindow(QMainWindow):
     """
@@ -58,6 +61,13 @@ class MainWindow(QMainWindow):
         
         # Initialize local pedagogical agent (always available, offline)
         self.agent = PedagogicalAgent()
+        # Pre-synthesize fixed feedback phrases so speech is instant later
+        self.agent.warm_cache_in_background()
+        
+        # Periodic TTS cache trim (kept off the speak path)
+        self._cache_sweep_timer = QTimer(self)
+        self._cache_sweep_timer.timeout.connect(self.agent.enforce_cache_limits)
+        self._cache_sweep_timer.start(TTS_CACHE_SWEEP_MS)
         
         # Initialize cloud tutor (optional, graceful fallback if unavailable)
         # API key from environment variable for security
@@ -343,11 +353,15 @@ class MainWindow(QMainWindow):
             needs_fresh_canvas = (self.drawing_passes >= MAX_DRAWING_PASSES)
             needs_scaffolding = (self.agent.consecutive_errors >= MAX_ATTEMPTS_BEFORE_SCAFFOLDING)
             
+            # Follow-up lines are known now: synthesize them while feedback plays
             if needs_fresh_canvas:
+                self.agent.prefetch(FRESH_CANVAS_MESSAGE)
                 QTimer.singleShot(1500, self._offer_fresh_canvas)
             elif needs_scaffolding:
                 # Only offer scaffolding if we AREN'T clearing the canvas
-                QTimer.singleShot(2500, self._offer_scaffolding)
+                scaffold = self.agent.get_scaffolding_offer()
+                self.agent.prefetch(scaffold)
+                QTimer.singleShot(2500, lambda: self._offer_scaffolding(scaffold))
     
     def _celebrate(self):
         """
@@ -359,15 +373,16 @@ class MainWindow(QMainWindow):
         self.feedback_label.setStyleSheet("color: #27ae60; font-weight: bold; padding: 15px;")
         self.celebration.celebrate()
     
-    def _offer_scaffolding(self):
+    def _offer_scaffolding(self, scaffold: str | None = None):
         """Offer help after multiple incorrect attempts."""
-        scaffold = self.agent.get_scaffolding_offer()
+        if scaffold is None:
+            scaffold = self.agent.get_scaffolding_offer()
         self.feedback_label.setText(scaffold)
         self.agent.speak(scaffold)
     
     def _offer_fresh_canvas(self):
         """Provide a fresh canvas after multiple drawing passes."""
-        self._clear_canvas("Let's try again on a fresh canvas!")
+        self._clear_canvas(FRESH_CANVAS_MESSAGE)
     
     def _clear_canvas(self, message: str):
         """Reset the scratchpad with a gentle, encouraging message."""
@@ -396,7 +411,9 @@ class MainWindow(QMainWindow):
         that they don't understand—this should be celebrated!
         """
         self.agent.speak("Great job asking for help! Let me give you a hint.")
-        QTimer.singleShot(1500, self._offer_scaffolding)
+        scaffold = self.agent.get_scaffolding_offer()
+        self.agent.prefetch(scaffold)
+        QTimer.singleShot(1500, lambda: self._offer_scaffolding(scaffold))
     
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts (for parents/testing)."""
@@ -416,6 +433,7 @@ class MainWindow(QMainWindow):
         Ensures learning data is persisted even on unexpected exit.
         """
         self.progress.end_session()
+        self.agent.shutdown()
         event.accept()
     
     # =========================================================================
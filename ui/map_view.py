@@ -4,6 +4,8 @@ Map View - Level Selection UI
 Displays the game map with unlockable level nodes.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 )
@@ -33,6 +35,10 @@ class MapView(QWidget):
         super().__init__()
         self.db = db
         self._level_buttons = []
+        self._last_unlocked = 0  # Buttons 1.._last_unlocked are styled available
+        # Stylesheets are constant; build them once instead of per refresh
+        self._style_available = self._available_style()
+        self._style_locked = self._locked_style()
         self._build_ui()
     
     def _build_ui(self):
@@ -52,15 +58,16 @@ class MapView(QWidget):
         
         header.addStretch()
         
+        body_font = QFont(FONT_FAMILY, FONT_SIZE_BODY)
         self.egg_label = QLabel("🥚 0 eggs")
-        self.egg_label.setFont(QFont(FONT_FAMILY, FONT_SIZE_BODY))
+        self.egg_label.setFont(body_font)
         header.addWidget(self.egg_label)
         
         layout.addLayout(header)
         
         # Instructions
         instructions = QLabel("Tap a level to start counting!")
-        instructions.setFont(QFont(FONT_FAMILY, FONT_SIZE_BODY))
+        instructions.setFont(body_font)
         instructions.setStyleSheet("color: #555555;")
         instructions.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(instructions)
@@ -69,13 +76,15 @@ class MapView(QWidget):
         levels_layout = QHBoxLayout()
         levels_layout.setSpacing(BUTTON_GAP)
         
+        btn_font = QFont(FONT_FAMILY, 24, QFont.Weight.Bold)  # Shared by all buttons
         for i in range(1, MAP_LEVELS_COUNT + 1):
             btn = QPushButton(str(i))
             btn.setFixedSize(MIN_TOUCH_TARGET, MIN_TOUCH_TARGET)
-            btn.setFont(QFont(FONT_FAMILY, 24, QFont.Weight.Bold))
-            btn.setStyleSheet(self._locked_style())
+            btn.setFont(btn_font)
+            btn.setStyleSheet(self._style_locked)
             btn.setEnabled(False)
-            btn.clicked.connect(lambda checked, level=i: self.level_selected.emit(level))
+            btn.setProperty("level", i)
+            btn.clicked.connect(self._on_level_clicked)
             self._level_buttons.append(btn)
             levels_layout.addWidget(btn)
         
@@ -83,6 +92,10 @@ class MapView(QWidget):
         layout.addLayout(levels_layout)
         layout.addStretch()
     
+    def _on_level_clicked(self):
+        """One slot for every level button; the button carries its level."""
+        self.level_selected.emit(self.sender().property("level"))
+    
     def _available_style(self) -> str:
         """Style for unlocked/available levels."""
         return f"""
@@ -111,17 +124,30 @@ class MapView(QWidget):
             }}
         """
     
-    async def refresh(self, egg_count: int):
-        """Update the map with current progress."""
+    async def refresh(self, egg_count: int, completed_level: Optional[int] = None):
+        """
+        Update the map with current progress.
+
+        completed_level: a level whose unlock the caller has just saved (pass it
+        only when unlock_level() returned True). Once the map has loaded
+        progress, this is folded in without a DB query.
+        """
         self.egg_label.setText(f"🥚 {egg_count} eggs")
         
-        # Get unlocked level from DB
-        unlocked = await self.db.get_unlocked_level()
+        if completed_level is not None and self._last_unlocked:
+            unlocked = max(self._last_unlocked, completed_level + 1)
+        else:
+            # Get unlocked level from DB
+            unlocked = await self.db.get_unlocked_level()
         
-        for idx, btn in enumerate(self._level_buttons, start=1):
-            if idx <= unlocked:
-                btn.setStyleSheet(self._available_style())
-                btn.setEnabled(True)
-            else:
-                btn.setStyleSheet(self._locked_style())
-                btn.setEnabled(False)
+        # Only buttons between the old and new unlock point change state;
+        # Qt would reparse an identical stylesheet on the rest
+        if unlocked == self._last_unlocked:
+            return
+        is_unlocked = unlocked > self._last_unlocked
+        lo, hi = sorted((self._last_unlocked, unlocked))
+        style = self._style_available if is_unlocked else self._style_locked
+        for btn in self._level_buttons[lo:hi]:
+            btn.setStyleSheet(style)
+            btn.setEnabled(is_unlocked)
+        self._last_unlocked = unlocked
@@ -12,7 +12,7 @@ from PySide6.QtGui import QFont, QColor, QIcon
 from ui.design_tokens import (
     COLORS, STYLES, FONT_FAMILY, FONT_SIZE_HEADING, FONT_SIZE_BODY
 )
-from ui.premium_utils import draw_premium_background, add_soft_shadow
+from ui.premium_utils import draw_premium_background, enable_premium_background, add_soft_shadow
 
 class PracticeDialog(QDialog):
     """
@@ -24,6 +24,7 @@ class PracticeDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Training Camp")
         self.setFixedSize(500, 450)
+        enable_premium_background(self)
         
         # Remove default frame for custom rounded look if we wanted frameless,
         # but for simplicity/stability we keep standard frame and style content.
@@ -34,7 +35,7 @@ class PracticeDialog(QDialog):
 
     def paintEvent(self, event):
         """Draw premium gradient background."""
-        draw_premium_background(self)
+        draw_premium_background(self, event)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
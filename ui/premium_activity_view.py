@@ -11,6 +11,8 @@ Claude's Implementation:
 Reference: The uploaded target design screenshot
 """
 
+import logging
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGraphicsDropShadowEffect, QFrame, QSizePolicy
@@ -30,6 +32,8 @@ from core.director import AppState
 from core.problems import ProblemData
 from ui.components import SkipOverlay
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # PREMIUM STYLES (Matching Reference Design)
@@ -61,7 +65,7 @@ EGG_COUNTER_STYLE = """
     }
 """
 
-ITEM_EMOJI_MAP = {item["name"]: item["emoji"] for item in CONCRETE_ITEMS}
+ITEM_EMOJI_MAP = {item.name: item.emoji for item in CONCRETE_ITEMS}
 
 BACK_BUTTON_STYLE = """
     QPushButton#BackButton {
@@ -228,6 +232,9 @@ class PremiumActivityView(QWidget):
         
         self._build_ui()
         self._skip_overlay = SkipOverlay(self, self.director)
+        
+        from ui.premium_utils import enable_premium_background
+        enable_premium_background(self)
     
     def _build_ui(self):
         """Build the premium UI."""
@@ -312,7 +319,7 @@ class PremiumActivityView(QWidget):
     
     def _build_question_card(self) -> QFrame:
         """Build the white rounded card for question display. RESPONSIVE UPDATE (Frontend Audit v3.0)"""
-        print("[PremiumActivityView] LAYOUT: Building responsive question card")
+        logger.debug("Building responsive question card")
         
         card = QFrame()
         card.setObjectName("QuestionCard")
@@ -446,7 +453,7 @@ class PremiumActivityView(QWidget):
         if not self._leavers:
             return
             
-        print(f"[PremiumActivityView] ANIM: Playing take-away for {len(self._leavers)} items")
+        logger.debug("Playing take-away for %d items", len(self._leavers))
         anim_group = QParallelAnimationGroup(self)
         
         for item in self._leavers:
@@ -477,7 +484,7 @@ class PremiumActivityView(QWidget):
     def paintEvent(self, event):
         """Draw premium background."""
         from ui.premium_utils import draw_premium_background
-        draw_premium_background(self)
+        draw_premium_background(self, event)
     
     def _on_option_clicked(self, button: PremiumAnswerButton):
         """Handle answer selection."""
@@ -552,6 +559,6 @@ class PremiumActivityView(QWidget):
     
     def show_visual_hint(self, hint_name: str):
         """Display a visual hint."""
-        print(f"[PremiumActivityView] Visual Hint: {hint_name}")
+        logger.debug("Visual hint: %s", hint_name)
 
 
@@ -8,6 +8,8 @@ Claude's Implementation matching reference design:
 - Generous whitespace
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGraphicsDropShadowEffect, QFrame, QGridLayout
@@ -66,16 +68,21 @@ class PremiumLevelButton(QPushButton):
     A premium level button with 3D effect and shadow.
     """
     
+    _font: Optional[QFont] = None  # Shared by all buttons; built on first use
+    
     def __init__(self, level: int, parent=None):
         super().__init__(str(level), parent)
         self.level = level
         self._unlocked = False
         
         self.setFixedSize(100, 100)
-        self.setFont(QFont(FONT_FAMILY, 28, QFont.Weight.Bold))
+        if PremiumLevelButton._font is None:
+            PremiumLevelButton._font = QFont(FONT_FAMILY, 28, QFont.Weight.Bold)
+        self.setFont(PremiumLevelButton._font)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         self._apply_locked_style()
+        self.setEnabled(False)  # Match _unlocked so set_unlocked can skip no-ops
     
     def _apply_unlocked_style(self):
         """Bright, inviting style for unlocked levels."""
@@ -113,6 +120,8 @@ class PremiumLevelButton(QPushButton):
     
     def set_unlocked(self, unlocked: bool):
         """Set the unlock state."""
+        if unlocked == self._unlocked:
+            return  # Already styled; skip the stylesheet reparse and new shadow
         self._unlocked = unlocked
         if unlocked:
             self._apply_unlocked_style()
@@ -148,6 +157,7 @@ class PremiumMapView(QWidget):
         super().__init__()
         self.db = db
         self._level_buttons = []
+        self._last_unlocked = 0  # Buttons 1.._last_unlocked are unlocked
         self._build_ui()
     
     def _build_ui(self):
@@ -268,7 +278,7 @@ class PremiumMapView(QWidget):
         # Create 2 rows of 5 buttons
         for i in range(1, MAP_LEVELS_COUNT + 1):
             btn = PremiumLevelButton(i)
-            btn.clicked.connect(lambda checked, level=i: self.level_selected.emit(level))
+            btn.clicked.connect(self._on_level_clicked)
             self._level_buttons.append(btn)
             
             row = (i - 1) // 5
@@ -277,6 +287,10 @@ class PremiumMapView(QWidget):
         
         return container
     
+    def _on_level_clicked(self):
+        """One slot for every level button; the button carries its level."""
+        self.level_selected.emit(self.sender().level)
+    
     def _on_practice_clicked(self):
         """Open the practice configuration dialog."""
         print(f"[PremiumMapView] ACTION: Opening PracticeDialog")
@@ -286,12 +300,27 @@ class PremiumMapView(QWidget):
             # Emit practice mode via separate signal
             self.practice_mode_selected.emit(dialog.selected_mode)
             
-    async def refresh(self, egg_count: int):
-        """Update the map with current progress."""
+    async def refresh(self, egg_count: int, completed_level: Optional[int] = None):
+        """
+        Update the map with current progress.
+
+        completed_level: a level whose unlock the caller has just saved (pass it
+        only when unlock_level() returned True). Once the map has loaded
+        progress, this is folded in without a DB query.
+        """
         self.egg_label.setText(f"{egg_count} eggs")
         
-        # Get unlocked level from DB
-        unlocked = await self.db.get_unlocked_level()
+        if completed_level is not None and self._last_unlocked:
+            unlocked = max(self._last_unlocked, completed_level + 1)
+        else:
+            # Get unlocked level from DB
+            unlocked = await self.db.get_unlocked_level()
         
-        for idx, btn in enumerate(self._level_buttons, start=1):
-            btn.set_unlocked(idx <= unlocked)
+        # Only buttons between the old and new unlock point change state
+        if unlocked == self._last_unlocked:
+            return
+        is_unlocked = unlocked > self._last_unlocked
+        lo, hi = sorted((self._last_unlocked, unlocked))
+        for btn in self._level_buttons[lo:hi]:
+            btn.set_unlocked(is_unlocked)
+        self._last_unlocked = unlocked
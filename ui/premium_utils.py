@@ -2,9 +2,27 @@
 Premium UI Utilities
 High-quality shadow effects and animations for the Sidereal Voyager UI.
 """
+import math
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QGraphicsDropShadowEffect
-from PySide6.QtCore import QPropertyAnimation, QSequentialAnimationGroup, QEasingCurve, QPoint
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QVariantAnimation, QRectF, Qt
+from PySide6.QtGui import QColor, QPixmap
+
+# Cream gradient stops for the premium background, built once at import
+_BG_STOPS = [
+    (0.0, QColor("#FEF9E7")),
+    (0.5, QColor("#FAF0DC")),
+    (1.0, QColor("#F5E6C8")),
+]
+
+# Shake offsets in units of amplitude: two swings (left first) damped to half,
+# ending centred. Precomputed so each frame is one table lookup.
+_SHAKE_STEPS = 60
+_SHAKE_LUT = tuple(
+    -math.exp(-2 * math.log(2) * t) * math.sin(4 * math.pi * t)
+    for t in (i / (_SHAKE_STEPS - 1) for i in range(_SHAKE_STEPS))
+)
 
 
 def add_soft_shadow(
@@ -39,47 +57,71 @@ def add_soft_shadow(
     widget.setGraphicsEffect(shadow)
 
 
-def create_shake_animation(widget: QWidget, amplitude: int = 8, duration: int = 50) -> QSequentialAnimationGroup:
+def create_shake_animation(widget: QWidget, amplitude: int = 8, duration: int = 50) -> QVariantAnimation:
     """
     Creates a 'shake' animation for incorrect answer feedback.
     
     Args:
         widget: The widget to shake.
         amplitude: Pixels to move left/right.
-        duration: Duration of each shake step in ms.
+        duration: Duration of each shake step in ms (five steps in total).
         
     Returns:
-        A QSequentialAnimationGroup that can be started.
+        A QVariantAnimation that can be started.
     """
-    group = QSequentialAnimationGroup(widget)
-    original = widget.pos()
+    anim = QVariantAnimation(widget)
+    anim.setStartValue(0)
+    anim.setEndValue(_SHAKE_STEPS - 1)
+    anim.setDuration(duration * 5)
     
-    # Shake sequence: left -> right -> left -> center
-    offsets = [-amplitude, amplitude, -amplitude // 2, amplitude // 2, 0]
+    x, y = widget.x(), widget.y()
+    anim.valueChanged.connect(lambda i: widget.move(x + round(amplitude * _SHAKE_LUT[i]), y))
+    
+    return anim
+
+
+@lru_cache(maxsize=8)
+def _premium_background_pixmap(width: int, height: int, dpr: float) -> QPixmap:
+    """Render the gradient once per widget size; repaints just blit it."""
+    from PySide6.QtGui import QPainter, QLinearGradient
     
-    for offset in offsets:
-        anim = QPropertyAnimation(widget, b"pos")
-        anim.setDuration(duration)
-        anim.setEndValue(QPoint(original.x() + offset, original.y()))
-        anim.setEasingCurve(QEasingCurve.Type.InOutSine)
-        group.addAnimation(anim)
+    pixmap = QPixmap(round(width * dpr), round(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
     
-    return group
+    painter = QPainter(pixmap)
+    gradient = QLinearGradient(0, 0, 0, height)
+    gradient.setStops(_BG_STOPS)
+    painter.fillRect(0, 0, width, height, gradient)
+    painter.end()
+    return pixmap
 
 
-def draw_premium_background(widget: QWidget):
+def enable_premium_background(widget: QWidget):
+    """
+    Mark a widget whose paintEvent calls draw_premium_background as opaque.
+    The gradient covers every pixel, so Qt can skip erasing the background
+    first. Call once from __init__.
+    """
+    widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+    widget.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+
+
+def draw_premium_background(widget: QWidget, event=None):
     """
     Draw the premium cream gradient background directly in a widget's paintEvent.
-    Call this from an overridden paintEvent method.
+    Call this from an overridden paintEvent method, passing the QPaintEvent so
+    only the dirty rectangle is copied. Pair with enable_premium_background().
     """
-    from PySide6.QtGui import QPainter, QLinearGradient, QColor
+    from PySide6.QtGui import QPainter
     
+    dpr = widget.devicePixelRatioF()
+    pixmap = _premium_background_pixmap(widget.width(), widget.height(), dpr)
     painter = QPainter(widget)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    
-    gradient = QLinearGradient(0, 0, 0, widget.height())
-    gradient.setColorAt(0.0, QColor("#FEF9E7"))
-    gradient.setColorAt(0.5, QColor("#FAF0DC"))
-    gradient.setColorAt(1.0, QColor("#F5E6C8"))
-    
-    painter.fillRect(widget.rect(), gradient)
+    if event is None:
+        painter.drawPixmap(0, 0, pixmap)
+    else:
+        dirty = QRectF(event.rect())
+        # Source rect is in pixmap (device) pixels
+        source = QRectF(dirty.x() * dpr, dirty.y() * dpr, dirty.width() * dpr, dirty.height() * dpr)
+        painter.drawPixmap(dirty, pixmap, source)
+    painter.end()
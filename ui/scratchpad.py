@@ -17,6 +17,7 @@ on the HP Omni.
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, QPointF, Signal, QTimer
 from PySide6.QtGui import QPainter, QPen, QColor, QPainterPath, QTabletEvent
+from array import array
 from dataclasses import dataclass, field
 from typing import List, Optional
 import sys
@@ -36,7 +37,8 @@ class Stroke:
     Five strokes = 5 (valid concrete representation in CPA framework)
     """
     points: List[QPointF] = field(default_factory=list)
-    pressures: List[float] = field(default_factory=list)  # Stylus pressure data
+    # Stylus pressure data, packed as C doubles (8 bytes/sample, no float objects)
+    pressures: array = field(default_factory=lambda: array('d'))
     
     def add_point(self, point: QPointF, pressure: float = 1.0):
         """Add a point to this stroke's path."""